@@ -1,15 +1,61 @@
+import asyncio
+import csv
+import functools
+import inspect
+import itertools
+import multiprocessing
+import os
+import pickle
+import random
+import struct
+import sys
+import tempfile
+import threading
+import time
 import tkinter as tk
+import tracemalloc
+import zlib
+from array import array
+from concurrent.futures import Future
+from multiprocessing import resource_tracker, shared_memory
 from tkinter import ttk, messagebox
 
+try:
+    import fcntl
+except ImportError:  # Windows: named SharedLRUCaches need an explicit lock
+    fcntl = None
+
+MISSING = object()  # Miss marker for caches whose values may be -1
+
 class Node:
-    def __init__(self, key, val):
+    def __init__(self, key, val, weight=1, expires=None):
         self.key, self.val = key, val
+        self.weight, self.expires = weight, expires
+        self.prev = self.next = None
+
+class SlotsNode:
+    """Node without a per-instance __dict__ (used by SlotsLRUCache)."""
+    __slots__ = ("key", "val", "weight", "expires", "prev", "next")
+
+    def __init__(self, key, val, weight=1, expires=None):
+        self.key, self.val = key, val
+        self.weight, self.expires = weight, expires
         self.prev = self.next = None
 
 class LRUCache:
-    def __init__(self, capacity: int):
+    node_class = Node
+
+    def __init__(self, capacity: int, ttl: float = None, weigher=None):
+        """capacity bounds the entry count, or the total weight if a
+        weigher(key, value) is given (e.g. one returning sizes in bytes).
+        ttl is the default lifetime in seconds; entries expire lazily on
+        access, or eagerly via expire() / CacheSweeper.
+        """
         self.cap = capacity
         self.cache = {}  # Map key to node
+        self.ttl = ttl
+        self.weigher = weigher
+        self.weight = 0  # Sum of node weights (entry count without a weigher)
 
         # Left = LRU, Right = Most Recent
         self.left, self.right = Node(0, 0), Node(0, 0)
@@ -26,24 +72,1361 @@ class LRUCache:
         prev.next = nxt.prev = node
         node.next, node.prev = nxt, prev
 
-    def get(self, key: int) -> int:
+    def discard(self, node):
+        """Remove node from both the list and the map."""
+        self.remove(node)
+        del self.cache[node.key]
+        self.weight -= node.weight
+
+    def get(self, key: int, default=-1) -> int:
         if key in self.cache:
-            self.remove(self.cache[key])
-            self.insert(self.cache[key])
-            return self.cache[key].val
-        return -1
+            node = self.cache[key]
+            if node.expires is not None and node.expires <= time.monotonic():
+                self.discard(node)
+                return default
+            self.remove(node)
+            self.insert(node)
+            return node.val
+        return default
 
-    def put(self, key: int, value: int) -> None:
+    def put(self, key: int, value: int, ttl: float = None) -> int:
+        """Insert or update key; ttl overrides the cache's default ttl.
+
+        Returns the number of entries evicted to make room.
+        """
         if key in self.cache:
-            self.remove(self.cache[key])
-        self.cache[key] = Node(key, value)
+            self.discard(self.cache[key])
+        weight = self.weigher(key, value) if self.weigher else 1
+        if weight > self.cap:
+            return 0  # Could never fit; don't flush the cache for it
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.monotonic() + ttl if ttl is not None else None
+        self.cache[key] = self.node_class(key, value, weight, expires)
         self.insert(self.cache[key])
+        self.weight += weight
 
-        if len(self.cache) > self.cap:
+        evicted = 0
+        while self.weight > self.cap:
             # Remove from the list and delete the LRU from the hash map
-            lru = self.left.next
-            self.remove(lru)
-            del self.cache[lru.key]
+            self.discard(self.left.next)
+            evicted += 1
+        return evicted
+
+    def get_many(self, keys, default=-1):
+        """Values for keys, identical to calling get() on each in order.
+
+        The loop is inlined and the clock read once per batch.
+        """
+        cache, right, results = self.cache, self.right, []
+        now = time.monotonic()
+        for key in keys:
+            node = cache.get(key)
+            if node is None:
+                results.append(default)
+            elif node.expires is not None and node.expires <= now:
+                self.discard(node)
+                results.append(default)
+            else:
+                # Move to the MRU end unless it is already there
+                if node.next is not right:
+                    prev, nxt = node.prev, node.next
+                    prev.next, nxt.prev = nxt, prev
+                    last = right.prev
+                    last.next = right.prev = node
+                    node.next, node.prev = right, last
+                results.append(node.val)
+        return results
+
+    def put_many(self, items, ttl: float = None) -> int:
+        """Apply put(key, value) for each (key, value) pair in order.
+
+        Without a weigher eviction is deferred to the end of the batch:
+        the survivors are the `cap` most recently put or read keys either
+        way. To return the same eviction count as put-by-put, the loop
+        tracks the oldest entry a put-by-put cache would still hold; the
+        entries behind it count as evicted, and putting one of them again
+        counts as a new entry. With a weigher, an update can shrink an
+        entry, so puts are applied one by one.
+        """
+        if self.weigher:
+            return sum(self.put(key, value, ttl) for key, value in items)
+        if self.cap <= 0:
+            return 0
+        cache, node_class, right = self.cache, self.node_class, self.right
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.monotonic() + ttl if ttl is not None else None
+        oldest = self.left.next if cache else None
+        held = len(cache)
+        evicted, evicted_keys = 0, set()
+        for key, value in items:
+            node = cache.get(key)
+            present = node is not None and key not in evicted_keys
+            if node is not None:
+                if node is oldest:
+                    oldest = node.next if node.next is not right else None
+                self.remove(node)
+                self.weight -= 1
+            node = cache[key] = node_class(key, value, 1, expires)
+            self.insert(node)
+            self.weight += 1
+            if oldest is None:
+                oldest = node
+            if present:
+                continue
+            evicted_keys.discard(key)
+            if held < self.cap:
+                held += 1
+            else:
+                evicted_keys.add(oldest.key)
+                oldest = oldest.next
+                evicted += 1
+        while self.weight > self.cap:
+            self.discard(self.left.next)
+        return evicted
+
+    def expire(self):
+        """Drop every expired entry; returns how many were removed."""
+        now = time.monotonic()
+        expired = [node for node in self.cache.values() if node.expires is not None and node.expires <= now]
+        for node in expired:
+            self.discard(node)
+        return len(expired)
+
+    def pop(self, key):
+        """Remove key and return its value (-1 if missing)."""
+        node = self.cache.get(key)
+        if node is None:
+            return -1
+        self.discard(node)
+        return node.val
+
+    def pop_lru(self):
+        """Remove and return the least recently used (key, value)."""
+        lru = self.left.next
+        if lru is self.right:
+            raise KeyError("pop_lru from an empty cache")
+        self.discard(lru)
+        return lru.key, lru.val
+
+    def lru_key(self):
+        """Key that would be evicted next, or None if empty."""
+        return self.left.next.key if self.cache else None
+
+    def __contains__(self, key):
+        return key in self.cache
+
+    def __len__(self):
+        return len(self.cache)
+
+class SlotsLRUCache(LRUCache):
+    """LRUCache whose nodes use __slots__, roughly halving per-entry memory."""
+    node_class = SlotsNode
+
+class ArrayLRUCache:
+    """LRU cache with no per-entry node objects.
+
+    Entries live in preallocated slots: keys and values in two lists, and
+    the recency list as prev/next slot indices in integer arrays. Slots 0
+    and 1 are the LRU and MRU sentinels; freed slots go on a free list.
+    Supports the plain get/put/pop interface (no ttl or weigher).
+    """
+    LEFT, RIGHT = 0, 1
+
+    def __init__(self, capacity: int):
+        self.cap = capacity
+        size = capacity + 2
+        self.cache = {}  # Map key to slot
+        self.keys = [None] * size
+        self.vals = [None] * size
+        self.prev = array('l', [0]) * size
+        self.next = array('l', [0]) * size
+        self.next[self.LEFT], self.prev[self.RIGHT] = self.RIGHT, self.LEFT
+        self.free = array('l', range(size - 1, 1, -1))
+
+    def remove(self, slot):
+        prev, nxt = self.prev[slot], self.next[slot]
+        self.next[prev], self.prev[nxt] = nxt, prev
+
+    def insert(self, slot):
+        prev = self.prev[self.RIGHT]
+        self.next[prev] = self.prev[self.RIGHT] = slot
+        self.next[slot], self.prev[slot] = self.RIGHT, prev
+
+    def release(self, slot):
+        """Unlink a slot, forget its key and put it on the free list."""
+        self.remove(slot)
+        del self.cache[self.keys[slot]]
+        self.keys[slot] = self.vals[slot] = None
+        self.free.append(slot)
+
+    def get(self, key: int, default=-1) -> int:
+        slot = self.cache.get(key)
+        if slot is None:
+            return default
+        self.remove(slot)
+        self.insert(slot)
+        return self.vals[slot]
+
+    def put(self, key: int, value: int) -> int:
+        slot = self.cache.get(key)
+        if slot is not None:
+            self.vals[slot] = value
+            self.remove(slot)
+            self.insert(slot)
+            return 0
+        if self.cap <= 0:
+            return 0
+        evicted = 0
+        if not self.free:
+            self.release(self.next[self.LEFT])
+            evicted = 1
+        slot = self.free.pop()
+        self.keys[slot], self.vals[slot] = key, value
+        self.cache[key] = slot
+        self.insert(slot)
+        return evicted
+
+    def pop(self, key):
+        slot = self.cache.get(key)
+        if slot is None:
+            return -1
+        value = self.vals[slot]
+        self.release(slot)
+        return value
+
+    def pop_lru(self):
+        slot = self.next[self.LEFT]
+        if slot == self.RIGHT:
+            raise KeyError("pop_lru from an empty cache")
+        item = self.keys[slot], self.vals[slot]
+        self.release(slot)
+        return item
+
+    def lru_key(self):
+        return self.keys[self.next[self.LEFT]] if self.cache else None
+
+    def items(self):
+        """(key, value) pairs from least to most recently used."""
+        slot = self.next[self.LEFT]
+        while slot != self.RIGHT:
+            yield self.keys[slot], self.vals[slot]
+            slot = self.next[slot]
+
+    def __contains__(self, key):
+        return key in self.cache
+
+    def __len__(self):
+        return len(self.cache)
+
+# Storage backends for a plain LRU, compared by memory_benchmark
+LRU_BACKENDS = {
+    "node": LRUCache,
+    "slots": SlotsLRUCache,
+    "array": ArrayLRUCache,
+}
+
+class SegmentedLRUCache:
+    """Segmented LRU (SLRU): new keys enter a probation segment and are
+    promoted to a protected segment on their second hit.
+
+    A one-off scan only churns the probation segment, so keys that are
+    used repeatedly survive in the protected segment.
+    """
+    def __init__(self, capacity: int, protected_ratio: float = 0.8):
+        self.cap = capacity
+        self.protected_cap = int(capacity * protected_ratio)
+        self.probation = LRUCache(capacity)
+        self.protected = LRUCache(capacity)
+
+    def get(self, key: int, default=-1) -> int:
+        if key in self.protected:
+            return self.protected.get(key, default)
+        if key in self.probation:
+            value = self.probation.pop(key)
+            self.promote(key, value)
+            return value
+        return default
+
+    def promote(self, key, value):
+        """Move a key into protected, demoting its LRU back to probation."""
+        evicted = self.protected.put(key, value)
+        if len(self.protected) > self.protected_cap:
+            evicted += self.probation.put(*self.protected.pop_lru())
+        return evicted
+
+    def put(self, key: int, value: int) -> int:
+        """Returns the number of entries evicted, as do the other policies' put."""
+        if key in self.protected:
+            evicted = self.protected.put(key, value)
+        elif key in self.probation:
+            self.probation.pop(key)
+            evicted = self.promote(key, value)
+        else:
+            evicted = self.probation.put(key, value)
+        while len(self) > self.cap:
+            self.evict()
+            evicted += 1
+        return evicted
+
+    def victim_key(self):
+        """Key the next eviction would remove."""
+        return self.probation.lru_key() if len(self.probation) else self.protected.lru_key()
+
+    def evict(self):
+        if len(self.probation):
+            return self.probation.pop_lru()
+        return self.protected.pop_lru()
+
+    def __contains__(self, key):
+        return key in self.probation or key in self.protected
+
+    def __len__(self):
+        return len(self.probation) + len(self.protected)
+
+class TwoQueueCache:
+    """2Q: first-time keys go to a FIFO (A1in); keys seen again after being
+    evicted from it (remembered in the ghost list A1out) go to the main LRU
+    (Am). Only keys with proven reuse displace the main LRU.
+    """
+    def __init__(self, capacity: int, in_ratio: float = 0.25, out_ratio: float = 0.5):
+        self.cap = capacity
+        self.in_cap = max(1, int(capacity * in_ratio))
+        self.a1in = LRUCache(capacity)  # FIFO: entries are never promoted
+        self.a1out = LRUCache(max(1, int(capacity * out_ratio)))  # Ghost keys only
+        self.am = LRUCache(capacity)
+
+    def get(self, key: int, default=-1) -> int:
+        if key in self.am:
+            return self.am.get(key, default)
+        if key in self.a1in:
+            return self.a1in.cache[key].val
+        return default
+
+    def put(self, key: int, value: int) -> int:
+        if key in self.am:
+            return self.am.put(key, value)
+        if key in self.a1in:
+            self.a1in.cache[key].val = value
+            return 0
+        if key in self.a1out:
+            self.a1out.pop(key)
+            evicted = self.reclaim()
+            return evicted + self.am.put(key, value)
+        evicted = self.reclaim()
+        return evicted + self.a1in.put(key, value)
+
+    def reclaim(self):
+        """Free one slot if the cache is full; returns the number evicted."""
+        if len(self) < self.cap:
+            return 0
+        if len(self.a1in) > self.in_cap or not len(self.am):
+            key, _ = self.a1in.pop_lru()
+            self.a1out.put(key, None)  # Ghost entries are not counted
+        else:
+            self.am.pop_lru()
+        return 1
+
+    def __contains__(self, key):
+        return key in self.am or key in self.a1in
+
+    def __len__(self):
+        return len(self.a1in) + len(self.am)
+
+class ARCCache:
+    """Adaptive Replacement Cache (Megiddo & Modha).
+
+    T1 holds keys seen once recently, T2 keys seen at least twice. The ghost
+    lists B1/B2 remember keys evicted from each, and hits on them shift the
+    target size p of T1 towards whichever side is currently losing hits.
+    """
+    def __init__(self, capacity: int):
+        self.cap = capacity
+        self.p = 0
+        self.t1, self.t2 = LRUCache(capacity), LRUCache(capacity)
+        self.b1, self.b2 = LRUCache(capacity), LRUCache(capacity)  # Ghost keys only
+
+    def get(self, key: int, default=-1) -> int:
+        if key in self.t1:
+            value = self.t1.pop(key)
+            self.t2.put(key, value)
+            return value
+        if key in self.t2:
+            return self.t2.get(key, default)
+        return default
+
+    def replace(self, in_b2):
+        """Evict from T1 or T2 into its ghost list, steered by p; returns the number evicted."""
+        if len(self.t1) + len(self.t2) < self.cap:
+            return 0
+        t1_len = len(self.t1)
+        if t1_len and (t1_len > self.p or (in_b2 and t1_len == self.p) or not len(self.t2)):
+            key, _ = self.t1.pop_lru()
+            self.b1.put(key, None)
+        else:
+            key, _ = self.t2.pop_lru()
+            self.b2.put(key, None)
+        return 1
+
+    def put(self, key: int, value: int) -> int:
+        # Only entries leaving T1/T2 count as evictions, not ghost list trimming
+        evicted = 0
+        if key in self.t1:
+            self.t1.pop(key)
+        elif key in self.t2:
+            pass
+        elif key in self.b1:
+            self.p = min(self.cap, self.p + max(len(self.b2) // len(self.b1), 1))
+            evicted = self.replace(False)
+            self.b1.pop(key)
+        elif key in self.b2:
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            evicted = self.replace(True)
+            self.b2.pop(key)
+        else:
+            l1 = len(self.t1) + len(self.b1)
+            total = l1 + len(self.t2) + len(self.b2)
+            if l1 >= self.cap:
+                if len(self.t1) < self.cap:
+                    self.b1.pop_lru()
+                    evicted = self.replace(False)
+                else:
+                    self.t1.pop_lru()
+                    evicted = 1
+            elif total >= self.cap:
+                if total >= 2 * self.cap:
+                    self.b2.pop_lru()
+                evicted = self.replace(False)
+            return evicted + self.t1.put(key, value)
+        return evicted + self.t2.put(key, value)
+
+    def __contains__(self, key):
+        return key in self.t1 or key in self.t2
+
+    def __len__(self):
+        return len(self.t1) + len(self.t2)
+
+class CountMinSketch:
+    """Approximate frequency counter with 4-bit saturating counters.
+
+    Counters are halved every `sample_size` increments so old popularity
+    fades (the TinyLFU reset).
+    """
+    def __init__(self, capacity: int, depth: int = 4):
+        width = 1
+        while width < max(capacity, 16):
+            width <<= 1
+        self.mask = width - 1
+        self.rows = [bytearray(width) for _ in range(depth)]
+        self.seeds = [random.Random(i).getrandbits(32) for i in range(depth)]
+        self.sample_size = 10 * width
+        self.additions = 0
+
+    def indexes(self, key):
+        h = hash(key)
+        return [hash((h, seed)) & self.mask for seed in self.seeds]
+
+    def increment(self, key):
+        for row, i in zip(self.rows, self.indexes(key)):
+            if row[i] < 15:
+                row[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.reset()
+
+    def estimate(self, key):
+        return min(row[i] for row, i in zip(self.rows, self.indexes(key)))
+
+    def reset(self):
+        for row in self.rows:
+            for i in range(len(row)):
+                row[i] >>= 1
+        self.additions //= 2
+
+class WTinyLFUCache:
+    """Window TinyLFU: a small LRU window in front of an SLRU main cache.
+
+    Keys evicted from the window only enter the main cache if the
+    count-min sketch says they are used more often than the main cache's
+    eviction victim, so scans and one-hit wonders are filtered out.
+    """
+    def __init__(self, capacity: int, window_ratio: float = 0.01):
+        self.cap = capacity
+        self.window_cap = max(1, int(capacity * window_ratio))
+        self.window = LRUCache(capacity)  # Overflow is handled by admit()
+        self.main = SegmentedLRUCache(max(capacity - self.window_cap, 0))
+        self.sketch = CountMinSketch(capacity)
+
+    def get(self, key: int, default=-1) -> int:
+        self.sketch.increment(key)
+        if key in self.window:
+            return self.window.get(key, default)
+        return self.main.get(key, default)
+
+    def put(self, key: int, value: int) -> int:
+        if key in self.window:
+            return self.window.put(key, value)
+        if key in self.main:
+            return self.main.put(key, value)
+        self.sketch.increment(key)
+        evicted = self.window.put(key, value)
+        if len(self.window) > self.window_cap:
+            evicted += self.admit(*self.window.pop_lru())
+        return evicted
+
+    def admit(self, key, value):
+        """Offer a key evicted from the window to the main cache.
+
+        Returns the number of entries that left the cache: the main cache's
+        victim, or the candidate itself if it is rejected.
+        """
+        if len(self.main) < self.main.cap:
+            return self.main.put(key, value)
+        victim = self.main.victim_key()
+        if victim is not None and self.sketch.estimate(key) > self.sketch.estimate(victim):
+            self.main.evict()
+            return 1 + self.main.put(key, value)
+        return 1
+
+    def __contains__(self, key):
+        return key in self.window or key in self.main
+
+    def __len__(self):
+        return len(self.window) + len(self.main)
+
+# Eviction policies selectable by name; all share the get/put interface
+CACHE_POLICIES = {
+    "lru": LRUCache,
+    "slru": SegmentedLRUCache,
+    "2q": TwoQueueCache,
+    "arc": ARCCache,
+    "tinylfu": WTinyLFUCache,
+}
+
+def make_cache(capacity: int, policy: str = "lru", **options):
+    """Create a cache with the named eviction policy.
+
+    Extra options (ttl, weigher) are passed to the policy's constructor;
+    only the "lru" policy supports them.
+    """
+    if policy not in CACHE_POLICIES:
+        raise ValueError(f"Unknown cache policy {policy!r}, choose from {sorted(CACHE_POLICIES)}")
+    cache_class = CACHE_POLICIES[policy]
+    if options and not issubclass(cache_class, LRUCache):
+        raise ValueError(f"Cache policy {policy!r} does not support {', '.join(sorted(options))}; "
+                         f"use the 'lru' policy")
+    return cache_class(capacity, **options)
+
+class CacheSweeper:
+    """Background thread that calls cache.expire() every `interval` seconds.
+
+    ConcurrentLRUCache locks its own shards; for a plain LRUCache pass the
+    lock that every other user of the cache holds.
+    """
+    def __init__(self, cache, interval: float = 1.0, lock=None):
+        self.cache = cache
+        self.interval = interval
+        self.lock = lock
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            if self.lock is None:
+                self.cache.expire()
+            else:
+                with self.lock:
+                    self.cache.expire()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+class ConcurrentLRUCache:
+    """Thread-safe LRU cache split into independently locked segments.
+
+    Each key hashes to one of `segments` LRUCache shards that owns its share
+    of the capacity, so threads working on different shards never contend.
+    Recency (and therefore eviction) is tracked per shard, using any policy
+    from CACHE_POLICIES. ttl and weigher options need the "lru" policy.
+    """
+    def __init__(self, capacity: int, segments: int = 16, policy: str = "lru", **options):
+        segments = max(1, min(segments, capacity))
+        base, extra = divmod(capacity, segments)
+        self.cap = capacity
+        self.shards = [make_cache(base + (1 if i < extra else 0), policy, **options) for i in range(segments)]
+        self.locks = [threading.Lock() for _ in range(segments)]
+
+    def shard_index(self, key):
+        return hash(key) % len(self.shards)
+
+    def get(self, key: int, default=-1) -> int:
+        i = self.shard_index(key)
+        with self.locks[i]:
+            return self.shards[i].get(key, default)
+
+    def put(self, key: int, value: int, **options) -> int:
+        i = self.shard_index(key)
+        with self.locks[i]:
+            return self.shards[i].put(key, value, **options)
+
+    def group_by_shard(self, keys):
+        groups = {}
+        for pos, key in enumerate(keys):
+            groups.setdefault(self.shard_index(key), []).append(pos)
+        return groups
+
+    def get_many(self, keys, default=-1):
+        """Batch get taking each touched shard's lock once."""
+        keys = list(keys)
+        results = [default] * len(keys)
+        for i, positions in self.group_by_shard(keys).items():
+            shard = self.shards[i]
+            with self.locks[i]:
+                if isinstance(shard, LRUCache):
+                    values = shard.get_many([keys[pos] for pos in positions], default)
+                else:
+                    values = [shard.get(keys[pos], default) for pos in positions]
+            for pos, value in zip(positions, values):
+                results[pos] = value
+        return results
+
+    def put_many(self, items, **options) -> int:
+        """Batch put taking each touched shard's lock once.
+
+        Shards are independent, so applying each shard's puts in their
+        original order matches applying the whole batch in order.
+        """
+        items = list(items)
+        evicted = 0
+        for i, positions in self.group_by_shard([key for key, _ in items]).items():
+            shard = self.shards[i]
+            batch = [items[pos] for pos in positions]
+            with self.locks[i]:
+                if isinstance(shard, LRUCache):
+                    evicted += shard.put_many(batch, **options)
+                else:
+                    for key, value in batch:
+                        evicted += shard.put(key, value, **options)
+        return evicted
+
+    def expire(self):
+        """Drop expired entries; policies without expiry have none to drop."""
+        removed = 0
+        for shard, lock in zip(self.shards, self.locks):
+            if hasattr(shard, "expire"):
+                with lock:
+                    removed += shard.expire()
+        return removed
+
+    def __contains__(self, key):
+        i = self.shard_index(key)
+        with self.locks[i]:
+            return key in self.shards[i]
+
+    def __len__(self):
+        return sum(len(shard) for shard in self.shards)
+
+class FileLock:
+    """Inter-process lock on a lock file (POSIX flock).
+
+    Unlike a multiprocessing.Lock it needs no common parent: any process
+    opening the same path shares it. flock does not exclude threads using
+    one open file, so a thread lock is taken first, and a forked child
+    reopens the file before using it.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.open()
+
+    def open(self):
+        self.pid = os.getpid()
+        self.file = open(self.path, 'a+b')
+        self.thread_lock = threading.Lock()
+
+    def acquire(self):
+        if self.pid != os.getpid():
+            self.open()
+        self.thread_lock.acquire()
+        fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+
+    def release(self):
+        fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        self.thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.path = state["path"]
+        self.open()
+
+CREATED_SEGMENTS = set()  # Shared memory names created by this process
+
+def attach_segment(name):
+    """Open an existing shared memory segment without taking ownership of it.
+
+    Before Python 3.13 opening a segment registers it with the process's
+    resource tracker, which unlinks it when that process exits. Processes
+    started by multiprocessing share their parent's tracker (and are not
+    named MainProcess, even while unpickling their arguments), so only
+    unrelated processes unregister it again.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if (os.name == "posix" and multiprocessing.current_process().name == "MainProcess"
+            and shm.name not in CREATED_SEGMENTS):
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+class SharedLRUCache:
+    """LRU cache whose table and recency list live in shared memory.
+
+    Any process that attaches to the same segment sees one shared cache.
+    Child processes get it by being passed the cache (it pickles as the
+    segment name plus the lock). Unrelated processes attach with
+    name=..., create=False: a cache created with a name and no lock uses a
+    FileLock next to the segment that they find by name, and for any other
+    lock the creator's lock must be passed in (otherwise ValueError).
+    Only the creator's unlink() destroys the segment. Keys and values are pickled into fixed-size slots of slot_size
+    bytes; keys are matched by their pickled bytes, so use simple keys
+    (ints, strings, tuples of those). A multiprocessing lock guards every
+    operation.
+
+    Layout: header, bucket heads (int32), then capacity + 2 slots, each a
+    24-byte record (prev, next, bucket chain, hash, key length, value
+    length) followed by the payload. Slots 0 and 1 are the LRU/MRU
+    sentinels, free slots are chained through their chain field.
+    """
+    HEADER = struct.Struct('<4sIIIiiI')  # magic, capacity, slot_size, buckets, count, free head, flags
+    META = struct.Struct('<iiiIII')
+    PREV, NEXT, CHAIN, HASH, KLEN, VLEN = 0, 4, 8, 12, 16, 20  # META field offsets
+    COUNT, FREE = 16, 20  # HEADER field offsets
+    LEFT, RIGHT = 0, 1
+    MAGIC = b'SLRU'
+    FILE_LOCK = 1  # Header flag: attach by name through lock_path()
+
+    def __init__(self, capacity: int, slot_size: int = 256, name: str = None, create: bool = True, lock=None):
+        if create:
+            flags = 0
+            if lock is None and name is not None and fcntl is not None:
+                lock, flags = FileLock(self.lock_path(name)), self.FILE_LOCK
+            self.lock = lock or multiprocessing.Lock()
+            buckets = 1
+            while buckets < capacity * 2:
+                buckets <<= 1
+            size = self.HEADER.size + 4 * buckets + (capacity + 2) * (self.META.size + slot_size)
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            CREATED_SEGMENTS.add(self.shm.name)
+            self.HEADER.pack_into(self.shm.buf, 0, self.MAGIC, capacity, slot_size, buckets, 0, -1, flags)
+            self.attach()
+            self.buf[self.HEADER.size:self.slots_start] = struct.pack(f'<{buckets}i', *[-1] * buckets)
+            self.set(self.LEFT, self.NEXT, self.RIGHT)
+            self.set(self.RIGHT, self.PREV, self.LEFT)
+            for slot in range(capacity + 1, 1, -1):
+                self.push_free(slot)
+        else:
+            self.shm = attach_segment(name)
+            self.attach()
+            if lock is None:
+                if not self.flags & self.FILE_LOCK:
+                    self.close()
+                    raise ValueError(f"SharedLRUCache {name!r} was not created with a file lock; "
+                                     "pass the creator's lock to attach to it")
+                lock = FileLock(self.lock_path(name))
+            self.lock = lock
+
+    @staticmethod
+    def lock_path(name):
+        return os.path.join(tempfile.gettempdir(), f"SharedLRUCache-{name.lstrip('/')}.lock")
+
+    def attach(self):
+        self.buf = self.shm.buf
+        magic, self.cap, self.slot_size, self.buckets, _, _, self.flags = self.HEADER.unpack_from(self.buf, 0)
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"Shared memory {self.shm.name!r} is not a SharedLRUCache")
+        self.slots_start = self.HEADER.size + 4 * self.buckets
+        self.record_size = self.META.size + self.slot_size
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def __getstate__(self):
+        # Child processes re-attach by name and share the creator's lock
+        return {"name": self.shm.name, "lock": self.lock}
+
+    def __setstate__(self, state):
+        self.lock = state["lock"]
+        self.shm = attach_segment(state["name"])
+        self.attach()
+
+    # Field access on slot records and the header
+    def field(self, slot, offset):
+        return struct.unpack_from('<i' if offset < self.HASH else '<I', self.buf,
+                                  self.slots_start + slot * self.record_size + offset)[0]
+
+    def set(self, slot, offset, value):
+        struct.pack_into('<i' if offset < self.HASH else '<I', self.buf,
+                         self.slots_start + slot * self.record_size + offset, value)
+
+    def header_field(self, offset):
+        return struct.unpack_from('<i', self.buf, offset)[0]
+
+    def set_header_field(self, offset, value):
+        struct.pack_into('<i', self.buf, offset, value)
+
+    def bucket_offset(self, h):
+        return self.HEADER.size + 4 * (h & (self.buckets - 1))
+
+    def push_free(self, slot):
+        self.set(slot, self.CHAIN, self.header_field(self.FREE))
+        self.set_header_field(self.FREE, slot)
+
+    # Recency list, as in ArrayLRUCache
+    def remove(self, slot):
+        prev, nxt = self.field(slot, self.PREV), self.field(slot, self.NEXT)
+        self.set(prev, self.NEXT, nxt)
+        self.set(nxt, self.PREV, prev)
+
+    def insert(self, slot):
+        prev = self.field(self.RIGHT, self.PREV)
+        self.set(prev, self.NEXT, slot)
+        self.set(self.RIGHT, self.PREV, slot)
+        self.set(slot, self.NEXT, self.RIGHT)
+        self.set(slot, self.PREV, prev)
+
+    def payload(self, slot):
+        start = self.slots_start + slot * self.record_size + self.META.size
+        klen, vlen = self.field(slot, self.KLEN), self.field(slot, self.VLEN)
+        return start, klen, vlen
+
+    def find(self, key_bytes, h):
+        """Return (slot, previous slot in the bucket chain) or (-1, -1)."""
+        slot = self.header_field(self.bucket_offset(h))
+        before = -1
+        while slot != -1:
+            if self.field(slot, self.HASH) == h:
+                start, klen, _ = self.payload(slot)
+                if self.buf[start:start + klen] == key_bytes:
+                    return slot, before
+            before, slot = slot, self.field(slot, self.CHAIN)
+        return -1, -1
+
+    def unchain(self, slot, before, h):
+        nxt = self.field(slot, self.CHAIN)
+        if before == -1:
+            self.set_header_field(self.bucket_offset(h), nxt)
+        else:
+            self.set(before, self.CHAIN, nxt)
+
+    def release(self, slot):
+        """Unlink slot from its bucket and the recency list, then free it."""
+        h = self.field(slot, self.HASH)
+        start, klen, _ = self.payload(slot)
+        found, before = self.find(bytes(self.buf[start:start + klen]), h)
+        self.unchain(found, before, h)
+        self.remove(slot)
+        self.push_free(slot)
+        self.set_header_field(self.COUNT, self.header_field(self.COUNT) - 1)
+
+    def encode_key(self, key):
+        key_bytes = pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+        return key_bytes, zlib.crc32(key_bytes)
+
+    def encode_item(self, key, value):
+        key_bytes, h = self.encode_key(key)
+        value_bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(key_bytes) + len(value_bytes) > self.slot_size:
+            raise ValueError(f"Key and value need {len(key_bytes) + len(value_bytes)} bytes, "
+                             f"slots hold {self.slot_size}")
+        return key_bytes, h, value_bytes
+
+    def lookup(self, key_bytes, h, default):
+        """get() body; the caller holds the lock."""
+        slot, _ = self.find(key_bytes, h)
+        if slot == -1:
+            return default
+        self.remove(slot)
+        self.insert(slot)
+        start, klen, vlen = self.payload(slot)
+        return pickle.loads(self.buf[start + klen:start + klen + vlen])
+
+    def store(self, key_bytes, h, value_bytes):
+        """put() body; the caller holds the lock. Returns the number evicted."""
+        slot, _ = self.find(key_bytes, h)
+        evicted = 0
+        if slot != -1:
+            self.remove(slot)
+        else:
+            slot = self.header_field(self.FREE)
+            if slot == -1:
+                self.release(self.field(self.LEFT, self.NEXT))
+                slot = self.header_field(self.FREE)
+                evicted = 1
+            self.set_header_field(self.FREE, self.field(slot, self.CHAIN))
+            bucket = self.bucket_offset(h)
+            self.set(slot, self.CHAIN, self.header_field(bucket))
+            self.set_header_field(bucket, slot)
+            self.set(slot, self.HASH, h)
+            self.set_header_field(self.COUNT, self.header_field(self.COUNT) + 1)
+        start = self.slots_start + slot * self.record_size + self.META.size
+        self.buf[start:start + len(key_bytes)] = key_bytes
+        self.buf[start + len(key_bytes):start + len(key_bytes) + len(value_bytes)] = value_bytes
+        self.set(slot, self.KLEN, len(key_bytes))
+        self.set(slot, self.VLEN, len(value_bytes))
+        self.insert(slot)
+        return evicted
+
+    def get(self, key, default=-1):
+        key_bytes, h = self.encode_key(key)
+        with self.lock:
+            return self.lookup(key_bytes, h, default)
+
+    def put(self, key, value) -> int:
+        encoded = self.encode_item(key, value)
+        if self.cap <= 0:
+            return 0
+        with self.lock:
+            return self.store(*encoded)
+
+    def get_many(self, keys, default=-1):
+        """Batch get: keys are pickled up front, then one lock acquisition."""
+        encoded = [self.encode_key(key) for key in keys]
+        with self.lock:
+            return [self.lookup(key_bytes, h, default) for key_bytes, h in encoded]
+
+    def put_many(self, items) -> int:
+        """Batch put: items are pickled (and size-checked) before taking the lock once.
+
+        Slots are fixed, so eviction still happens per put.
+        """
+        encoded = [self.encode_item(key, value) for key, value in items]
+        if self.cap <= 0:
+            return 0
+        with self.lock:
+            return sum(self.store(*item) for item in encoded)
+
+    def pop(self, key):
+        key_bytes, h = self.encode_key(key)
+        with self.lock:
+            slot, _ = self.find(key_bytes, h)
+            if slot == -1:
+                return -1
+            start, klen, vlen = self.payload(slot)
+            value = pickle.loads(self.buf[start + klen:start + klen + vlen])
+            self.release(slot)
+            return value
+
+    def __contains__(self, key):
+        key_bytes, h = self.encode_key(key)
+        with self.lock:
+            return self.find(key_bytes, h)[0] != -1
+
+    def __len__(self):
+        with self.lock:
+            return self.header_field(self.COUNT)
+
+    def close(self):
+        """Detach this process from the segment."""
+        self.buf = None
+        self.shm.close()
+
+    def unlink(self):
+        """Destroy the segment (call once, from the creating process)."""
+        self.shm.unlink()
+        CREATED_SEGMENTS.discard(self.shm.name)
+        if self.flags & self.FILE_LOCK:
+            try:
+                os.remove(self.lock_path(self.shm.name))
+            except OSError:
+                pass
+
+class CacheStats:
+    """Hit/miss/eviction counters plus log2-bucketed op latency histograms."""
+    def __init__(self):
+        self.hits = self.misses = self.puts = self.evictions = 0
+        self.latency = {"get": [0] * 64, "put": [0] * 64}  # Bucket b: < 2**b ns
+        self.lock = threading.Lock()
+
+    def record(self, op, elapsed_ns, hit=None, evicted=0):
+        with self.lock:
+            if op == "get":
+                if hit:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            else:
+                self.puts += 1
+                self.evictions += evicted
+            self.latency[op][min(elapsed_ns.bit_length(), 63)] += 1
+
+    def hit_ratio(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def percentile(self, op, q):
+        """Upper bound (ns) of the histogram bucket holding quantile q."""
+        buckets = self.latency[op]
+        target = q * sum(buckets)
+        running = 0
+        for b, count in enumerate(buckets):
+            running += count
+            if count and running >= target:
+                return 1 << b
+        return 0
+
+    def export(self):
+        """Plain dict snapshot, ready for json.dump or a CSV row."""
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "puts": self.puts,
+                "evictions": self.evictions,
+                "hit_ratio": self.hit_ratio(),
+                "get_p50_ns": self.percentile("get", 0.5),
+                "get_p99_ns": self.percentile("get", 0.99),
+                "put_p50_ns": self.percentile("put", 0.5),
+                "put_p99_ns": self.percentile("put", 0.99),
+                "latency_histograms": {op: {f"<{1 << b}ns": n for b, n in enumerate(buckets) if n}
+                                       for op, buckets in self.latency.items()},
+            }
+
+class InstrumentedCache:
+    """Wraps any cache from this module and records CacheStats for it."""
+    def __init__(self, cache):
+        self.cache = cache
+        self.cap = cache.cap
+        self.stats = CacheStats()
+
+    def get(self, key: int, default=-1) -> int:
+        start = time.perf_counter_ns()
+        value = self.cache.get(key, MISSING)
+        self.stats.record("get", time.perf_counter_ns() - start, hit=value is not MISSING)
+        return default if value is MISSING else value
+
+    def put(self, key: int, value: int) -> int:
+        start = time.perf_counter_ns()
+        # Every cache's put reports its own evictions, under its own locks
+        evicted = self.cache.put(key, value)
+        self.stats.record("put", time.perf_counter_ns() - start, evicted=evicted)
+        return evicted
+
+    def __contains__(self, key):
+        return key in self.cache
+
+    def __len__(self):
+        return len(self.cache)
+
+class LoadingCache:
+    """LRU cache that loads missing keys itself, one load per key at a time.
+
+    Concurrent get_or_load calls that miss on the same key share a single
+    loader call: the first caller runs it and the rest wait on its result,
+    so a cold cache does not send N identical loads to the backend.
+    Loader errors are passed to every waiter and are not cached.
+    """
+    def __init__(self, capacity: int, ttl: float = None, **options):
+        self.cache = LRUCache(capacity, ttl=ttl, **options)
+        self.lock = threading.Lock()
+        self.loading = {}  # key -> Future of the in-flight load
+
+    def get_or_load(self, key, loader):
+        with self.lock:
+            value = self.cache.get(key, MISSING)
+            if value is not MISSING:
+                return value
+            future = self.loading.get(key)
+            leader = future is None
+            if leader:
+                future = self.loading[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            value = loader(key)
+        except BaseException as e:
+            with self.lock:
+                del self.loading[key]
+            future.set_exception(e)
+            raise
+        with self.lock:
+            self.cache.put(key, value)
+            del self.loading[key]
+        future.set_result(value)
+        return value
+
+    def invalidate(self, key):
+        with self.lock:
+            self.cache.pop(key)
+
+    def __len__(self):
+        return len(self.cache)
+
+class AsyncLoadingCache:
+    """asyncio counterpart of LoadingCache for coroutine loaders.
+
+    All access happens on the event loop thread, so no lock is needed.
+    Each load runs as its own task, which every caller missing on the key
+    awaits through asyncio.shield, so cancelling any caller (the first
+    one included) leaves the load and the other callers alone.
+    """
+    def __init__(self, capacity: int, ttl: float = None, **options):
+        self.cache = LRUCache(capacity, ttl=ttl, **options)
+        self.loading = {}  # key -> asyncio.Task of the in-flight load
+
+    async def get_or_load(self, key, loader):
+        value = self.cache.get(key, MISSING)
+        if value is not MISSING:
+            return value
+        task = self.loading.get(key)
+        if task is None:
+            task = self.loading[key] = asyncio.ensure_future(loader(key))
+            task.add_done_callback(lambda done: self.finish(key, done))
+        return await asyncio.shield(task)
+
+    def finish(self, key, task):
+        """Done-callback of a load: cache its value and forget the task.
+
+        Errors are passed to the waiters but not cached.
+        """
+        if self.loading.get(key) is task:
+            del self.loading[key]
+        if not task.cancelled() and task.exception() is None:
+            self.cache.put(key, task.result())
+
+    def invalidate(self, key):
+        self.cache.pop(key)
+
+    def __len__(self):
+        return len(self.cache)
+
+KWARGS_MARK = object()  # Separates positional from keyword arguments in lru_cached keys
+
+def lru_cached(capacity: int = 128, ttl: float = None):
+    """Memoize a function (or coroutine function) in a loading LRU cache.
+
+    Arguments must be hashable. Concurrent calls with the same arguments
+    run the function once. The cache is available as wrapper.cache.
+    """
+    def decorator(func):
+        def make_key(args, kwargs):
+            return args + (KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+
+        if inspect.iscoroutinefunction(func):
+            cache = AsyncLoadingCache(capacity, ttl)
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await cache.get_or_load(make_key(args, kwargs), lambda _: func(*args, **kwargs))
+        else:
+            cache = LoadingCache(capacity, ttl)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return cache.get_or_load(make_key(args, kwargs), lambda _: func(*args, **kwargs))
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+def check_invariants(cache):
+    """Raise AssertionError if an LRUCache's map and list disagree."""
+    seen = weight = 0
+    node = cache.left.next
+    while node != cache.right:
+        assert cache.cache.get(node.key) is node, f"Key {node.key} missing from map"
+        assert node.next.prev is node, "Broken back link"
+        seen += 1
+        weight += node.weight
+        node = node.next
+    assert seen == len(cache.cache), "List and map sizes differ"
+    assert weight == cache.weight, "Tracked weight is wrong"
+    assert weight <= cache.cap, "Cache over capacity"
+
+def stress_test(cache=None, threads=16, ops=20000, key_space=1000):
+    """Hammer a cache from many threads and check it stays consistent.
+
+    Every put stores value key * 2, so any value read back that is not
+    twice its key means a lost or torn update.
+    """
+    if cache is None:
+        cache = ConcurrentLRUCache(256)
+    errors = []
+
+    def worker(seed):
+        rng = random.Random(seed)
+        try:
+            for _ in range(ops):
+                key = rng.randrange(key_space)
+                if rng.random() < 0.5:
+                    cache.put(key, key * 2)
+                else:
+                    value = cache.get(key)
+                    if value not in (-1, key * 2):
+                        errors.append((key, value))
+        except Exception as e:
+            errors.append(e)
+
+    pool = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+
+    for shard in getattr(cache, 'shards', [cache]):
+        if isinstance(shard, LRUCache):
+            check_invariants(shard)
+    assert not errors, f"Inconsistent reads: {errors[:5]}"
+    return {"threads": threads, "ops": threads * ops, "size": len(cache)}
+
+def shared_worker(cache, seed, ops, key_space, errors):
+    """One process of shared_stress_test (module level so it pickles)."""
+    rng = random.Random(seed)
+    for _ in range(ops):
+        key = rng.randrange(key_space)
+        if rng.random() < 0.5:
+            cache.put(key, key * 2)
+        else:
+            value = cache.get(key)
+            if value not in (-1, key * 2):
+                errors.put((key, value))
+    cache.close()
+
+def shared_stress_test(processes=4, ops=5000, capacity=256, key_space=1000):
+    """Run several processes against one SharedLRUCache and check it."""
+    cache = SharedLRUCache(capacity)
+    errors = multiprocessing.Queue()
+    try:
+        pool = [multiprocessing.Process(target=shared_worker, args=(cache, seed, ops, key_space, errors))
+                for seed in range(processes)]
+        for p in pool:
+            p.start()
+        for p in pool:
+            p.join()
+        assert all(p.exitcode == 0 for p in pool), "A worker process failed"
+        assert errors.empty(), f"Inconsistent read: {errors.get()}"
+        # Every key on the recency list must be found again through its bucket
+        size = len(cache)
+        slot, seen = cache.field(cache.LEFT, cache.NEXT), 0
+        while slot != cache.RIGHT:
+            start, klen, _ = cache.payload(slot)
+            assert cache.find(bytes(cache.buf[start:start + klen]), cache.field(slot, cache.HASH))[0] == slot
+            seen += 1
+            slot = cache.field(slot, cache.NEXT)
+        assert seen == size <= capacity, "List, count and capacity disagree"
+        return {"processes": processes, "ops": processes * ops, "size": size}
+    finally:
+        cache.close()
+        cache.unlink()
+
+# Trace generators for the benchmark harness
+def zipf_trace(length, key_space=10000, alpha=1.0, seed=0):
+    """Keys drawn from a Zipf(alpha) popularity distribution."""
+    rng = random.Random(seed)
+    weights = list(itertools.accumulate(1 / (rank ** alpha) for rank in range(1, key_space + 1)))
+    keys = list(range(key_space))
+    rng.shuffle(keys)  # Popularity should not follow key order
+    return rng.choices(keys, cum_weights=weights, k=length)
+
+def scan_trace(length, hot_keys=500, scan_length=5000, seed=0):
+    """Zipf-like hot set interrupted by long one-off sequential scans."""
+    trace = []
+    hot = zipf_trace(length, hot_keys, seed=seed)
+    next_scan = hot_keys
+    for i, key in enumerate(hot):
+        trace.append(key)
+        if i % (scan_length * 2) == scan_length * 2 - 1:
+            trace.extend(range(next_scan, next_scan + scan_length))
+            next_scan += scan_length
+    return trace[:length]
+
+def loop_trace(length, loop_size=1000):
+    """The same keys accessed cyclically, the worst case for LRU."""
+    return [i % loop_size for i in range(length)]
+
+def load_trace(path):
+    """One key per line; numeric keys are read as ints."""
+    with open(path) as f:
+        return [int(line) if line.strip().lstrip('-').isdigit() else line.strip() for line in f if line.strip()]
+
+def replay(cache, trace):
+    """Replay a trace as read-through traffic; returns (hit_ratio, ops_per_sec)."""
+    hits = 0
+    start = time.perf_counter()
+    for key in trace:
+        if cache.get(key) != -1:
+            hits += 1
+        else:
+            cache.put(key, key)
+    elapsed = time.perf_counter() - start
+    return hits / len(trace), len(trace) / elapsed if elapsed else float('inf')
+
+def run_benchmark(traces, capacities, policies=None, csv_path=None):
+    """Replay every trace at every capacity for every policy.
+
+    Returns rows of trace, policy, capacity, hit_ratio and ops_per_sec,
+    and writes them to csv_path if given.
+    """
+    rows = []
+    for trace_name, trace in traces.items():
+        for policy in policies or list(CACHE_POLICIES):
+            for capacity in capacities:
+                hit_ratio, ops_per_sec = replay(make_cache(capacity, policy), trace)
+                rows.append({"trace": trace_name, "policy": policy, "capacity": capacity,
+                             "hit_ratio": round(hit_ratio, 4), "ops_per_sec": round(ops_per_sec)})
+    if csv_path:
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    return rows
+
+def memory_benchmark(entries=100000, backends=None):
+    """Bytes allocated per entry for each LRU backend, measured with tracemalloc.
+
+    Every backend stores the same int objects (value is key), so the
+    differences come from the cache structure itself.
+    """
+    results = {}
+    for name in backends or list(LRU_BACKENDS):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        cache = LRU_BACKENDS[name](entries)
+        for key in range(entries):
+            cache.put(key, key)
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        results[name] = (after - before) / entries
+        del cache
+    return results
+
+def benchmark_main(args):
+    """Usage: python LRU.py bench [trace_file ...]"""
+    length = 100000
+    traces = {path: load_trace(path) for path in args}
+    if not traces:
+        traces = {
+            "zipf": zipf_trace(length),
+            "scan": scan_trace(length),
+            "loop": loop_trace(length),
+        }
+    rows = run_benchmark(traces, [100, 500, 1000, 2000, 5000], csv_path="lru_benchmark.csv")
+    print(f"{'trace':<12}{'policy':<10}{'capacity':>10}{'hit ratio':>12}{'ops/sec':>12}")
+    for row in rows:
+        print(f"{row['trace']:<12}{row['policy']:<10}{row['capacity']:>10}"
+              f"{row['hit_ratio']:>12.4f}{row['ops_per_sec']:>12}")
+    print("Results written to lru_benchmark.csv")
 
 # Initialize LRU Cache with default capacity
 cache = LRUCache(3)
@@ -79,36 +1462,49 @@ def update_cache_view():
         cache_listbox.insert(tk.END, f"Key: {node.key}, Value: {node.val}")
         node = node.next
 
-# UI Setup
-root = tk.Tk()
-root.title("LRU Cache Manager")
-
-# Key Entry
-frame_key = ttk.LabelFrame(root, text="Key-Value Input")
-frame_key.pack(padx=10, pady=5, fill="x")
-ttk.Label(frame_key, text="Key: ").grid(row=0, column=0, padx=5, pady=5)
-entry_key = ttk.Entry(frame_key)
-entry_key.grid(row=0, column=1, padx=5, pady=5)
-ttk.Label(frame_key, text="Value: ").grid(row=0, column=2, padx=5, pady=5)
-entry_value = ttk.Entry(frame_key)
-entry_value.grid(row=0, column=3, padx=5, pady=5)
-
-# Buttons
-frame_buttons = ttk.Frame(root)
-frame_buttons.pack(padx=10, pady=5, fill="x")
-btn_get = ttk.Button(frame_buttons, text="Get", command=handle_get)
-btn_get.pack(side="left", padx=5)
-btn_put = ttk.Button(frame_buttons, text="Put", command=handle_put)
-btn_put.pack(side="left", padx=5)
-
-# Cache View
-frame_cache = ttk.LabelFrame(root, text="Cache State")
-frame_cache.pack(padx=10, pady=5, fill="both", expand=True)
-cache_listbox = tk.Listbox(frame_cache, height=10)
-cache_listbox.pack(padx=5, pady=5, fill="both", expand=True)
-
-# Initial Cache View Update
-update_cache_view()
-
-# Run the application
-root.mainloop()
+if __name__ == "__main__":
+    if sys.argv[1:] == ["stress"]:
+        print(stress_test())
+        print(shared_stress_test())
+        sys.exit()
+    if sys.argv[1:2] == ["memory"]:
+        for name, per_entry in memory_benchmark(*map(int, sys.argv[2:3])).items():
+            print(f"{name:<8}{per_entry:>10.1f} bytes/entry")
+        sys.exit()
+    if sys.argv[1:2] == ["bench"]:
+        benchmark_main(sys.argv[2:])
+        sys.exit()
+
+    # UI Setup
+    root = tk.Tk()
+    root.title("LRU Cache Manager")
+
+    # Key Entry
+    frame_key = ttk.LabelFrame(root, text="Key-Value Input")
+    frame_key.pack(padx=10, pady=5, fill="x")
+    ttk.Label(frame_key, text="Key: ").grid(row=0, column=0, padx=5, pady=5)
+    entry_key = ttk.Entry(frame_key)
+    entry_key.grid(row=0, column=1, padx=5, pady=5)
+    ttk.Label(frame_key, text="Value: ").grid(row=0, column=2, padx=5, pady=5)
+    entry_value = ttk.Entry(frame_key)
+    entry_value.grid(row=0, column=3, padx=5, pady=5)
+
+    # Buttons
+    frame_buttons = ttk.Frame(root)
+    frame_buttons.pack(padx=10, pady=5, fill="x")
+    btn_get = ttk.Button(frame_buttons, text="Get", command=handle_get)
+    btn_get.pack(side="left", padx=5)
+    btn_put = ttk.Button(frame_buttons, text="Put", command=handle_put)
+    btn_put.pack(side="left", padx=5)
+
+    # Cache View
+    frame_cache = ttk.LabelFrame(root, text="Cache State")
+    frame_cache.pack(padx=10, pady=5, fill="both", expand=True)
+    cache_listbox = tk.Listbox(frame_cache, height=10)
+    cache_listbox.pack(padx=5, pady=5, fill="both", expand=True)
+
+    # Initial Cache View Update
+    update_cache_view()
+
+    # Run the application
+    root.mainloop()
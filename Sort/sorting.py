@@ -2,141 +2,921 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.transforms import Bbox
+import csv
+import heapq
+import itertools
+import os
+import sys
+import tempfile
 import time
 import random
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil, floor, log, log2
 
-# Sorting algorithms with visualization
+# Sorting algorithms as step generators
+#
+# Each algorithm sorts a plain list in place and yields one event per step:
+#   ("compare", i, j)   arr[i] and arr[j] were compared
+#   ("swap", i, j)      arr[i] and arr[j] were exchanged
+#   ("shift", src, dst) arr[dst] = arr[src]
+#   ("write", dst, v)   arr[dst] = v
+# Running a generator to the end sorts the list at full speed; the
+# visualizer pulls the events a frame's worth at a time and plays them at a
+# chosen frame rate, so the sort advances with the animation.
 
 # Bubble Sort Algorithm:
 # Repeatedly swaps adjacent elements if they are in the wrong order.
 # This continues until the entire list is sorted.
-def bubble_sort(arr, bars, texts, colors):
+def bubble_sort(arr):
     n = len(arr)
     for i in range(n):
         for j in range(n - i - 1):
-            original_colors = colors[:]
-            highlight_bars(bars, texts, [j, j + 1], colors)
+            yield ("compare", j, j + 1)
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                colors[j], colors[j + 1] = colors[j + 1], colors[j]  # Maintain original colors after swap
-                update_bars(bars, texts, arr, colors)
-            restore_colors(bars, texts, original_colors)
+                yield ("swap", j, j + 1)
 
 # Selection Sort Algorithm:
 # Finds the smallest element in the list and swaps it with the first element.
 # Repeats the process for the remaining unsorted portion.
-def selection_sort(arr, bars, texts, colors):
+def selection_sort(arr):
     n = len(arr)
     for i in range(n):
         min_idx = i
         for j in range(i + 1, n):
-            original_colors = colors[:]
-            highlight_bars(bars, texts, [min_idx, j], colors)
+            yield ("compare", min_idx, j)
             if arr[j] < arr[min_idx]:
                 min_idx = j
-        arr[i], arr[min_idx] = arr[min_idx], arr[i]
-        colors[i], colors[min_idx] = colors[min_idx], colors[i]  # Maintain original colors after swap
-        update_bars(bars, texts, arr, colors)
-        restore_colors(bars, texts, original_colors)
+        if min_idx != i:
+            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+            yield ("swap", i, min_idx)
 
 # Insertion Sort Algorithm:
 # Takes one element at a time and inserts it into its correct position.
 # Works well for small or nearly sorted lists.
-def insertion_sort(arr, bars, texts, colors):
-    for i in range(1, len(arr)):
+def insertion_sort(arr):
+    yield from insertion_sort_range(arr, 0, len(arr))
+
+def insertion_sort_range(arr, lo, hi):
+    """Insertion sort of arr[lo:hi] (also used inside quick and natural merge sort)."""
+    for i in range(lo + 1, hi):
         key = arr[i]
-        key_color = colors[i]
         j = i - 1
-        original_colors = colors[:]  # Ensure original_colors is always defined
-        while j >= 0 and arr[j] > key:
-            highlight_bars(bars, texts, [j, j + 1], colors)
+        while j >= lo:
+            yield ("compare", j, j + 1)
+            if arr[j] <= key:
+                break
             arr[j + 1] = arr[j]
-            colors[j + 1] = colors[j]  # Maintain original colors after shift
+            yield ("shift", j, j + 1)
             j -= 1
-        arr[j + 1] = key
-        colors[j + 1] = key_color
-        update_bars(bars, texts, arr, colors)
-        restore_colors(bars, texts, original_colors)
-
-# Visualization functions
-def highlight_bars(bars, texts, indices, colors):
-    temp_colors = colors[:]
-    for idx in indices:
-        temp_colors[idx] = 'black'  # Selector is black only
-    update_bars(bars, texts, heights, temp_colors)
-    time.sleep(0.5)
-
-def restore_colors(bars, texts, colors):
-    update_bars(bars, texts, heights, colors)
-    time.sleep(0.5)
-
-def update_bars(bars, texts, heights, colors):
-    for bar, text, height, color in zip(bars, texts, heights, colors):
-        bar.set_height(height)
-        bar.set_color(color)
-        text.set_position((bar.get_x() + bar.get_width() / 2, height + 1))
-        text.set_text(str(height))
-    plt.pause(0.5)
+        if j + 1 != i:
+            arr[j + 1] = key
+            yield ("write", j + 1, key)
+
+# Merge Sort Algorithm:
+# Splits the list in half, sorts each half and merges the two sorted halves.
+# Always O(n log n) comparisons, using O(n) extra space.
+def merge_sort(arr):
+    yield from merge_sort_range(arr, 0, len(arr))
+
+def merge_sort_range(arr, lo, hi):
+    if hi - lo < 2:
+        return
+    mid = (lo + hi) // 2
+    yield from merge_sort_range(arr, lo, mid)
+    yield from merge_sort_range(arr, mid, hi)
+    yield from merge(arr, lo, mid, hi)
+
+def merge(arr, lo, mid, hi):
+    """Merge the sorted runs arr[lo:mid] and arr[mid:hi] (stable)."""
+    left = arr[lo:mid]
+    i, j, k = 0, mid, lo
+    while i < len(left) and j < hi:
+        yield ("compare", lo + i, j)
+        if arr[j] < left[i]:
+            arr[k] = arr[j]
+            yield ("shift", j, k)
+            j += 1
+        else:
+            arr[k] = left[i]
+            yield ("write", k, left[i])
+            i += 1
+        k += 1
+    while i < len(left):
+        arr[k] = left[i]
+        yield ("write", k, left[i])
+        i += 1
+        k += 1
+
+# Quick Sort Algorithm (introsort):
+# Partitions around the median of the first, middle and last elements and
+# recurses into each side. Small partitions are finished with insertion
+# sort, and if the recursion gets too deep (a bad pivot sequence) the
+# partition is heap sorted instead, so the worst case stays O(n log n).
+QUICK_SORT_CUTOFF = 8
+
+def quick_sort(arr):
+    if len(arr) > 1:
+        yield from introsort(arr, 0, len(arr), 2 * int(log2(len(arr))))
+
+def introsort(arr, lo, hi, depth_limit):
+    while hi - lo > QUICK_SORT_CUTOFF:
+        if depth_limit == 0:
+            yield from heap_sort_range(arr, lo, hi)
+            return
+        depth_limit -= 1
+        p = yield from partition(arr, lo, hi)
+        # Recurse into the smaller side, loop on the larger one
+        if p - lo < hi - p:
+            yield from introsort(arr, lo, p, depth_limit)
+            lo = p + 1
+        else:
+            yield from introsort(arr, p + 1, hi, depth_limit)
+            hi = p
+    yield from insertion_sort_range(arr, lo, hi)
+
+def partition(arr, lo, hi):
+    """Median-of-three partition of arr[lo:hi]; returns the pivot's final index."""
+    mid, last = (lo + hi) // 2, hi - 1
+    for a, b in ((lo, mid), (mid, last), (lo, mid)):
+        yield ("compare", a, b)
+        if arr[b] < arr[a]:
+            arr[a], arr[b] = arr[b], arr[a]
+            yield ("swap", a, b)
+    # arr[lo] <= pivot <= arr[last] now act as sentinels
+    arr[mid], arr[last - 1] = arr[last - 1], arr[mid]
+    yield ("swap", mid, last - 1)
+    pivot = arr[last - 1]
+    i, j = lo, last - 1
+    while True:
+        i += 1
+        while True:
+            yield ("compare", i, last - 1)
+            if not arr[i] < pivot:
+                break
+            i += 1
+        j -= 1
+        while True:
+            yield ("compare", j, last - 1)
+            if not pivot < arr[j]:
+                break
+            j -= 1
+        if i >= j:
+            break
+        arr[i], arr[j] = arr[j], arr[i]
+        yield ("swap", i, j)
+    arr[i], arr[last - 1] = arr[last - 1], arr[i]
+    yield ("swap", i, last - 1)
+    return i
+
+# Heap Sort Algorithm:
+# Builds a max-heap, then repeatedly swaps the largest element to the end
+# and restores the heap. O(n log n) in every case and sorts in place.
+def heap_sort(arr):
+    yield from heap_sort_range(arr, 0, len(arr))
+
+def heap_sort_range(arr, lo, hi):
+    n = hi - lo
+    for start in range(n // 2 - 1, -1, -1):
+        yield from sift_down(arr, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        yield ("swap", lo, lo + end)
+        yield from sift_down(arr, lo, 0, end)
+
+def sift_down(arr, lo, root, size):
+    """Restore the max-heap below root in the heap arr[lo:lo + size]."""
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        if child + 1 < size:
+            yield ("compare", lo + child, lo + child + 1)
+            if arr[lo + child] < arr[lo + child + 1]:
+                child += 1
+        yield ("compare", lo + root, lo + child)
+        if not arr[lo + root] < arr[lo + child]:
+            return
+        arr[lo + root], arr[lo + child] = arr[lo + child], arr[lo + root]
+        yield ("swap", lo + root, lo + child)
+        root = child
+
+# Natural Merge Sort Algorithm (Timsort-style):
+# Finds runs that are already ascending (reversing strictly descending
+# ones), extends short runs to a minimum length with insertion sort and
+# merges runs from a stack that keeps their lengths balanced. Nearly
+# sorted input needs close to n comparisons.
+def min_run_length(n):
+    r = 0
+    while n >= 32:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def natural_merge_sort(arr):
+    n = len(arr)
+    min_run = min_run_length(n)
+    runs = []  # Stack of (start, length)
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n:
+            yield ("compare", hi - 1, hi)
+            if arr[hi] < arr[hi - 1]:
+                hi += 1
+                while hi < n:
+                    yield ("compare", hi - 1, hi)
+                    if not arr[hi] < arr[hi - 1]:
+                        break
+                    hi += 1
+                # Reverse the strictly descending run
+                i, j = lo, hi - 1
+                while i < j:
+                    arr[i], arr[j] = arr[j], arr[i]
+                    yield ("swap", i, j)
+                    i += 1
+                    j -= 1
+            else:
+                hi += 1
+                while hi < n:
+                    yield ("compare", hi - 1, hi)
+                    if arr[hi] < arr[hi - 1]:
+                        break
+                    hi += 1
+        if hi - lo < min_run:
+            hi = min(lo + min_run, n)
+            yield from insertion_sort_range(arr, lo, hi)
+        runs.append((lo, hi - lo))
+        yield from collapse_runs(arr, runs, force=False)
+        lo = hi
+    yield from collapse_runs(arr, runs, force=True)
+
+def collapse_runs(arr, runs, force):
+    """Merge runs until lengths shrink geometrically up the stack (or one run is left if force)."""
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if not force:
+            if n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]:
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                return
+        elif n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+            n -= 1
+        (lo, len_a), (mid, len_b) = runs[n], runs[n + 1]
+        yield from merge(arr, lo, mid, mid + len_b)
+        runs[n:n + 2] = [(lo, len_a + len_b)]
+
+# Counting Sort Algorithm (integers only):
+# Counts how often each value occurs and writes the values back in order.
+# No comparisons; O(n + k) for a value range of size k.
+def counting_sort(arr):
+    if not arr:
+        return
+    low = min(arr)
+    counts = [0] * (max(arr) - low + 1)
+    for value in arr:
+        counts[value - low] += 1
+    k = 0
+    for offset, count in enumerate(counts):
+        for _ in range(count):
+            arr[k] = offset + low
+            yield ("write", k, offset + low)
+            k += 1
+
+# LSD Radix Sort Algorithm (integers only):
+# Stable counting sort on each digit, least significant digit first.
+# No comparisons; O(d * (n + base)) for d-digit numbers.
+def radix_sort(arr, base=10):
+    if not arr:
+        return
+    low = min(arr)  # Offset so negative numbers work
+    largest = max(arr) - low
+    exp = 1
+    while largest // exp > 0:
+        buckets = [[] for _ in range(base)]
+        for value in arr:
+            buckets[(value - low) // exp % base].append(value)
+        k = 0
+        for bucket in buckets:
+            for value in bucket:
+                arr[k] = value
+                yield ("write", k, value)
+                k += 1
+        exp *= base
+
+SORTS = {
+    "Bubble Sort": bubble_sort,
+    "Selection Sort": selection_sort,
+    "Insertion Sort": insertion_sort,
+    "Merge Sort": merge_sort,
+    "Quick Sort": quick_sort,
+    "Heap Sort": heap_sort,
+    "Natural Merge Sort": natural_merge_sort,
+    "Counting Sort": counting_sort,
+    "Radix Sort": radix_sort,
+}
+
+# Sorts that only accept integers
+INTEGER_SORTS = {"Counting Sort", "Radix Sort"}
+MAX_COUNTING_RANGE = 10 ** 6  # Counting Sort allocates one counter per value in the range
+
+def check_input(algorithm, data):
+    """Why the algorithm should not be run on data, or None if it can be."""
+    if algorithm in INTEGER_SORTS and not all(isinstance(value, int) for value in data):
+        return f"{algorithm} only sorts integers."
+    if algorithm == "Counting Sort" and data and max(data) - min(data) >= MAX_COUNTING_RANGE:
+        return (f"Counting Sort would need {max(data) - min(data) + 1:,} counters for this range of values. "
+                "Use Radix Sort instead.")
+    return None
+
+def run_sort(algorithm, data):
+    """Sort a copy of data at full speed; returns (sorted list, step counts).
+
+    Besides the per-event counts, "comparisons" counts compare events and
+    "moves" counts element writes (a swap moves two elements).
+    """
+    sort = SORTS[algorithm] if isinstance(algorithm, str) else algorithm
+    arr = list(data)
+    counts = {"compare": 0, "swap": 0, "shift": 0, "write": 0}
+    for event in sort(arr):
+        counts[event[0]] += 1
+    counts["comparisons"] = counts["compare"]
+    counts["moves"] = 2 * counts["swap"] + counts["shift"] + counts["write"]
+    return arr, counts
+
+# Fast paths
+def numpy_sort(data, kind="quicksort"):
+    """Sort with NumPy's compiled kernels (kind: quicksort, mergesort, heapsort or stable)."""
+    return np.sort(np.asarray(data), kind=kind)
+
+def numpy_counting_sort(data):
+    """Vectorised counting sort for integers: one bincount and one repeat."""
+    values = np.asarray(data, dtype=np.int64)
+    if values.size == 0:
+        return values
+    low = values.min()
+    counts = np.bincount(values - low)
+    return np.repeat(np.arange(len(counts), dtype=np.int64) + low, counts)
+
+def sort_chunk(chunk, algorithm=None):
+    """Sort one chunk in a worker process (module level so it pickles)."""
+    if algorithm is None:
+        return sorted(chunk)
+    return run_sort(algorithm, chunk)[0]
+
+def parallel_merge_sort(data, workers=None, algorithm=None):
+    """Sort chunks on a process pool, then k-way merge the sorted runs with a heap.
+
+    Each of the `workers` chunks is sorted with the built-in sort, or with
+    one of SORTS if algorithm is given.
+    """
+    data = list(data)
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or len(data) < 2 * workers:
+        return sort_chunk(data, algorithm)
+    size = -(-len(data) // workers)
+    chunks = [data[i:i + size] for i in range(0, len(data), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        runs = list(pool.map(sort_chunk, chunks, [algorithm] * len(chunks)))
+    return list(heapq.merge(*runs))
+
+def compare_fast_paths(n=10 ** 6, workers=None, seed=0):
+    """Time the pure-Python, built-in, NumPy and parallel sorts on one random input.
+
+    Every result is checked against sorted(); returns {name: seconds}.
+    """
+    data = generate_input("random", n, seed)
+    expected = sorted(data)
+    candidates = {
+        "Merge Sort (pure Python)": lambda: run_sort("Merge Sort", data)[0],
+        "Quick Sort (pure Python)": lambda: run_sort("Quick Sort", data)[0],
+        "built-in sorted": lambda: sorted(data),
+        "NumPy quicksort": lambda: numpy_sort(data).tolist(),
+        "NumPy stable": lambda: numpy_sort(data, "stable").tolist(),
+        "NumPy counting sort": lambda: numpy_counting_sort(data).tolist(),
+        "Parallel merge sort": lambda: parallel_merge_sort(data, workers),
+        "Parallel merge sort (pure Python chunks)": lambda: parallel_merge_sort(data, workers, "Merge Sort"),
+    }
+    timings = {}
+    for name, sort in candidates.items():
+        start = time.perf_counter()
+        result = sort()
+        timings[name] = time.perf_counter() - start
+        assert result == expected, f"{name} returned a wrong result"
+    return timings
+
+def fast_main(args):
+    """Usage: python sorting.py fast [n] [workers]"""
+    n = int(args[0]) if args else 10 ** 6
+    workers = int(args[1]) if len(args) > 1 else None
+    timings = compare_fast_paths(n, workers)
+    baseline = timings["Merge Sort (pure Python)"]
+    print(f"Sorting {n} random integers with {workers or os.cpu_count()} workers")
+    for name, seconds in timings.items():
+        print(f"{name:<42}{seconds:>10.3f} s{baseline / seconds:>10.1f}x")
+
+# External merge sort
+def read_items(path, parse=int, block_size=1 << 16):
+    """Stream items from a text file.
+
+    With parse=int, integers may be separated by newlines, spaces or commas;
+    the file is read in blocks of block_size characters, so even a single
+    comma-separated line is never held in memory at once. With parse=None
+    every line (without its newline) is one record.
+    """
+    with open(path) as f:
+        if parse is None:
+            for line in f:
+                yield line.rstrip('\n')
+            return
+        partial = ''
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            tokens = (partial + block).replace(',', ' ').split()
+            # A token running into the block boundary continues in the next block
+            partial = tokens.pop() if tokens and not (block[-1].isspace() or block[-1] == ',') else ''
+            for token in tokens:
+                yield parse(token)
+        if partial:
+            yield parse(partial)
+
+def write_items(path, items):
+    with open(path, 'w') as f:
+        for item in items:
+            f.write(f"{item}\n")
+
+def external_sort(input_path, output_path, run_size=1_000_000, fan_in=64, parse=int, key=None, temp_dir=None):
+    """Sort a file that does not fit in memory.
+
+    Items are read in runs of run_size, each run is sorted in memory and
+    spilled to a temporary file, then the runs are k-way merged with a heap,
+    at most fan_in at a time (extra merge passes are made if there are more
+    runs). Memory is bounded by run_size items plus one read buffer per
+    merged run. Output has one item per line. Returns a dict of stats.
+    """
+    if run_size < 1 or fan_in < 2:
+        raise ValueError("run_size must be at least 1 and fan_in at least 2")
+    with tempfile.TemporaryDirectory(dir=temp_dir) as work_dir:
+        runs, items = [], 0
+        batch = []
+
+        def spill():
+            path = os.path.join(work_dir, f"run{len(runs)}.txt")
+            batch.sort(key=key)
+            write_items(path, batch)
+            runs.append(path)
+            batch.clear()
+
+        for item in read_items(input_path, parse):
+            batch.append(item)
+            items += 1
+            if len(batch) >= run_size:
+                spill()
+        if batch or not runs:
+            spill()
+        initial_runs = len(runs)
+
+        passes = 0
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                path = os.path.join(work_dir, f"pass{passes}_{i // fan_in}.txt")
+                write_items(path, heapq.merge(*(read_items(run, parse) for run in group), key=key))
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+            passes += 1
+        write_items(output_path, heapq.merge(*(read_items(run, parse) for run in runs), key=key))
+        passes += 1
+    return {"items": items, "runs": initial_runs, "merge passes": passes}
+
+def external_main(args):
+    """Usage: python sorting.py external INPUT OUTPUT [run_size] [fan_in]"""
+    if len(args) < 2:
+        print(external_main.__doc__)
+        return
+    run_size = int(args[2]) if len(args) > 2 else 1_000_000
+    fan_in = int(args[3]) if len(args) > 3 else 64
+    start = time.perf_counter()
+    stats = external_sort(args[0], args[1], run_size, fan_in)
+    print(f"Sorted {stats['items']} integers in {time.perf_counter() - start:.2f} s "
+          f"({stats['runs']} runs, {stats['merge passes']} merge passes)")
+
+# Benchmark mode
+def generate_input(kind, n, seed=0):
+    """Benchmark input of size n: random, sorted, reverse, few-unique or nearly-sorted."""
+    rng = random.Random(seed)
+    if kind == "random":
+        return [rng.randrange(n * 10) for _ in range(n)]
+    if kind == "sorted":
+        return list(range(n))
+    if kind == "reverse":
+        return list(range(n, 0, -1))
+    if kind == "few-unique":
+        return [rng.randrange(10) for _ in range(n)]
+    if kind == "nearly-sorted":
+        arr = list(range(n))
+        for _ in range(max(1, n // 100)):  # Swap about 1% of the elements
+            i, j = rng.randrange(n), rng.randrange(n)
+            arr[i], arr[j] = arr[j], arr[i]
+        return arr
+    raise ValueError(f"Unknown input kind {kind!r}")
+
+INPUT_KINDS = ["random", "sorted", "reverse", "few-unique", "nearly-sorted"]
+BENCHMARK_SIZES = [10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6]
+
+def fit_complexity(sizes, values):
+    """Fit values ~ c * n^k on a log-log scale.
+
+    Returns (k, best model), where the model is whichever of n, n log n
+    and n^2 gives the most constant ratio value / model(n).
+    """
+    points = [(n, v) for n, v in zip(sizes, values) if n > 1 and v > 0]
+    if len(points) < 2:
+        return None, None
+    xs = [log(n) for n, _ in points]
+    ys = [log(v) for _, v in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    slope = (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+             / sum((x - mean_x) ** 2 for x in xs))
+    models = {"n": lambda n: n, "n log n": lambda n: n * log2(n), "n^2": lambda n: n * n}
+
+    def spread(model):
+        ratios = [log(v / model(n)) for n, v in points]
+        mean = sum(ratios) / len(ratios)
+        return sum((r - mean) ** 2 for r in ratios)
+    return slope, min(models, key=lambda name: spread(models[name]))
+
+def run_benchmark(algorithms=None, kinds=None, sizes=None, time_limit=5.0):
+    """Time every algorithm on every input kind across sizes.
+
+    A size is skipped once the time predicted from the previous size (using
+    the slope measured so far, n^2 until two points exist) exceeds time_limit
+    seconds, so the quadratic sorts stop early while the others reach 10^6.
+    Fast runs are repeated for at least 50 ms and the best time is kept.
+    Times include the cost of consuming the step events.
+    """
+    rows = []
+    for algorithm in algorithms or list(SORTS):
+        for kind in kinds or INPUT_KINDS:
+            measured = []
+            for n in sizes or BENCHMARK_SIZES:
+                if measured:
+                    prev_n, prev_time = measured[-1]
+                    exponent = fit_complexity(*zip(*measured))[0] if len(measured) > 1 else 2
+                    if prev_time * (n / prev_n) ** max(exponent or 2, 1) > time_limit:
+                        break
+                data = generate_input(kind, n)
+                elapsed, total = float('inf'), 0.0
+                while total < 0.05:
+                    start = time.perf_counter()
+                    arr, counts = run_sort(algorithm, data)
+                    run_time = time.perf_counter() - start
+                    elapsed, total = min(elapsed, run_time), total + run_time
+                assert arr == sorted(data), f"{algorithm} failed on {kind} input"
+                measured.append((n, elapsed))
+                rows.append({"algorithm": algorithm, "input": kind, "size": n, "seconds": elapsed,
+                             "comparisons": counts["comparisons"], "moves": counts["moves"]})
+    return rows
+
+def summarize_benchmark(rows):
+    """Empirical exponent and best-fitting model per algorithm and input kind."""
+    summary = []
+    for key in dict.fromkeys((row["algorithm"], row["input"]) for row in rows):
+        group = [row for row in rows if (row["algorithm"], row["input"]) == key]
+        sizes = [row["size"] for row in group]
+        time_slope, time_model = fit_complexity(sizes, [row["seconds"] for row in group])
+        _, comparison_model = fit_complexity(sizes, [row["comparisons"] for row in group])
+        summary.append({"algorithm": key[0], "input": key[1], "max size": sizes[-1],
+                        "time exponent": time_slope, "time fit": time_model,
+                        "comparisons fit": comparison_model})
+    return summary
+
+def save_benchmark(rows, csv_path="sort_benchmark.csv", plot_path="sort_benchmark.png", kind="random"):
+    """Write all rows to CSV and a log-log plot of time and comparisons for one input kind."""
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    fig, (ax_time, ax_cmp) = plt.subplots(1, 2, figsize=(12, 5))
+    for algorithm in dict.fromkeys(row["algorithm"] for row in rows):
+        group = [row for row in rows if row["algorithm"] == algorithm and row["input"] == kind]
+        if not group:
+            continue
+        sizes = [row["size"] for row in group]
+        ax_time.plot(sizes, [row["seconds"] for row in group], marker='o', label=algorithm)
+        comparisons = [(n, row["comparisons"]) for n, row in zip(sizes, group) if row["comparisons"]]
+        if comparisons:
+            ax_cmp.plot(*zip(*comparisons), marker='o', label=algorithm)
+    for ax, ylabel in ((ax_time, "Seconds"), (ax_cmp, "Comparisons")):
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel("Input size")
+        ax.set_ylabel(ylabel)
+        ax.set_title(f"{ylabel} on {kind} input")
+        ax.grid(True, which='both', alpha=0.3)
+    ax_time.legend(fontsize=8)
+    fig.tight_layout()
+    fig.savefig(plot_path)
+    plt.close(fig)
+
+def benchmark_main(args):
+    """Usage: python sorting.py bench [time_limit_seconds]"""
+    plt.switch_backend("Agg")
+    rows = run_benchmark(time_limit=float(args[0]) if args else 5.0)
+    save_benchmark(rows)
+    print(f"{'algorithm':<20}{'input':<15}{'max size':>10}{'exponent':>10}  {'time fit':<10}{'comparisons fit'}")
+    for row in summarize_benchmark(rows):
+        exponent = f"{row['time exponent']:.2f}" if row['time exponent'] is not None else "-"
+        print(f"{row['algorithm']:<20}{row['input']:<15}{row['max size']:>10}{exponent:>10}  "
+              f"{row['time fit'] or '-':<10}{row['comparisons fit'] or '-'}")
+    print("Results written to sort_benchmark.csv and sort_benchmark.png")
+
+# Visualization
+class BarRenderer:
+    """Replays sort events on a matplotlib bar chart.
+
+    Playback runs at `steps_per_second`; above `max_fps` several steps are
+    coalesced into one frame. On canvases that support blitting only the
+    area touched by changed bars is redrawn, instead of the whole figure:
+    the pixel columns covered by their old and new bars and labels are
+    restored from a saved background, and every bar and label overlapping
+    them is drawn again, clipped to those columns. Value labels are skipped
+    for more than `label_limit` bars.
+
+    Bar colors follow the values, so an element keeps its color as it moves.
+    The two bars of the latest comparison are drawn black. Comparisons and
+    moves are counted as the events are played.
+    """
+    def __init__(self, ax, data, steps_per_second=4.0, max_fps=30, label_limit=100):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.heights = list(data)
+        self.steps_per_frame = max(1, int(-(-steps_per_second // max_fps)))
+        self.frame_interval = self.steps_per_frame / steps_per_second
+        self.blit = getattr(self.canvas, 'supports_blit', False)
+        self.background = None
+        self.highlighted = ()
+        self.comparisons = self.moves = 0
+        palette = plt.cm.tab10.colors
+        self.value_colors = {}
+        for value in self.heights:
+            self.value_colors.setdefault(value, palette[len(self.value_colors) % len(palette)])
+
+        x_pos = np.arange(len(self.heights))
+        self.bars = ax.bar(x_pos, self.heights, color=self.colors(), animated=self.blit)
+        if len(self.heights) <= label_limit:
+            self.texts = [ax.text(i, v + 1, str(v), ha='center', fontsize=10, animated=self.blit)
+                          for i, v in enumerate(self.heights)]
+        else:
+            self.texts = []
+        if self.heights:
+            # Fixed limits, so the saved background stays valid
+            low, high = min(0, min(self.heights)), max(0, max(self.heights))
+            margin = (high - low) * 0.1 + 1
+            ax.set_xlim(-0.5, len(self.heights) - 0.5)
+            ax.set_ylim(low - (margin if low < 0 else 0), high + margin)
+        if self.blit:
+            self.canvas.mpl_connect('draw_event', self.on_draw)
+
+    def colors(self):
+        return [self.value_colors[v] for v in self.heights]
+
+    def on_draw(self, event):
+        """After a full redraw (first show, resize): save the background, redraw the bars."""
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        for artist in self.bars.patches + self.texts:
+            if artist.get_animated():  # Once finished they are part of the normal draw
+                self.ax.draw_artist(artist)
+
+    def apply(self, event):
+        """Update the model heights for one event; returns the indices it changed."""
+        kind, a, b = event
+        if kind == "compare":
+            self.comparisons += 1
+        else:
+            self.moves += 2 if kind == "swap" else 1
+        if kind == "swap":
+            self.heights[a], self.heights[b] = self.heights[b], self.heights[a]
+            return (a, b)
+        if kind == "shift":
+            self.heights[b] = self.heights[a]
+            return (b,)
+        if kind == "write":
+            self.heights[a] = b
+            return (a,)
+        return ()
+
+    def update_artists(self, indices):
+        """Move the bars and labels at indices to the current heights."""
+        for i in indices:
+            bar, height = self.bars[i], self.heights[i]
+            bar.set_height(height)
+            bar.set_facecolor('black' if i in self.highlighted else self.value_colors[height])
+            if self.texts:
+                text = self.texts[i]
+                text.set_position((bar.get_x() + bar.get_width() / 2, height + 1))
+                text.set_text(str(height))
+
+    @staticmethod
+    def pixel_span(artist):
+        """Pixel x-range covered by artist, padded by a pixel."""
+        box = artist.get_window_extent()
+        return floor(box.x0) - 1, ceil(box.x1) + 1
+
+    def spans(self, indices):
+        """Pixel x-ranges covered by the bars and labels at indices."""
+        return [self.pixel_span(artist) for i in indices
+                for artist in ((self.bars[i], self.texts[i]) if self.texts else (self.bars[i],))]
+
+    @staticmethod
+    def merge(spans, width):
+        """Merge x-ranges into sorted, disjoint strips within [0, width)."""
+        strips = []
+        for x0, x1 in sorted(spans):
+            x0, x1 = max(x0, 0), min(x1, width)
+            if strips and x0 <= strips[-1][1]:
+                strips[-1][1] = max(strips[-1][1], x1)
+            elif x0 < x1:
+                strips.append([x0, x1])
+        return strips
+
+    def draw_bars(self, indices):
+        """Show the current heights of the bars at indices."""
+        indices = sorted(set(indices))
+        if not self.blit or self.background is None:
+            self.update_artists(indices)
+            if not self.blit:
+                self.canvas.draw_idle()
+            return
+        if not indices:
+            return
+        spans = self.spans(indices)
+        self.update_artists(indices)
+        spans += self.spans(indices)
+        width, height = ceil(self.canvas.figure.bbox.width), self.canvas.figure.bbox.height
+
+        # Restored strips must hold every label they touch whole: Agg renders
+        # clipped text slightly differently, so labels are never clipped
+        labels = [(text, self.pixel_span(text)) for text in self.texts]
+        strips = self.merge(spans, width)
+        while True:
+            touched = [span for _, span in labels
+                       if any(span[0] < x1 and x0 < span[1] for x0, x1 in strips)]
+            grown = self.merge(spans + touched, width)
+            if grown == strips:
+                break
+            strips = grown
+
+        to_data = self.ax.transData.inverted()
+        for x0, x1 in strips:
+            # The background is a whole-figure copy, so its pixel origin is
+            # (0, 0); Agg restores the bbox edges inclusively
+            self.canvas.restore_region(self.background, bbox=(x0, 0, x1 - 1, ceil(height)), xy=(0, 0))
+            strip = Bbox([[x0, 0], [x1, height]])
+            (d0, _), (d1, _) = to_data.transform([(x0, 0), (x1, 0)])
+            for i in range(max(floor(d0 - 0.5), 0), min(ceil(d1 + 0.5), len(self.bars) - 1) + 1):
+                bar = self.bars[i]
+                axes_clip = bar.get_clip_box()
+                clip = Bbox.intersection(axes_clip, strip)
+                if clip is not None:
+                    bar.set_clip_box(clip)
+                    self.ax.draw_artist(bar)
+                    bar.set_clip_box(axes_clip)
+            for text, (t0, t1) in labels:
+                if t0 < x1 and x0 < t1:
+                    self.ax.draw_artist(text)
+        if strips:
+            self.canvas.blit(Bbox([[strips[0][0], 0], [strips[-1][1], height]]))
+
+    def play(self, events):
+        """Play events back, one frame per steps_per_frame events.
+
+        events may be a generator: it is read one frame's batch at a time, so
+        the sort runs alongside the animation and is never stored whole.
+        """
+        if self.blit and self.background is None:
+            self.canvas.draw()  # Triggers on_draw, which saves the background
+        events = iter(events)
+        next_frame = time.perf_counter()
+        while True:
+            batch = list(itertools.islice(events, self.steps_per_frame))
+            if not batch:
+                break
+            dirty = set(self.highlighted)
+            highlight = ()
+            for event in batch:
+                dirty.update(self.apply(event))
+                if event[0] == "compare":
+                    highlight = event[1:]
+            self.highlighted = highlight
+            dirty.update(highlight)
+            self.draw_bars(dirty)
+            next_frame += self.frame_interval
+            # Keep the GUI responsive while waiting for the next frame
+            self.canvas.start_event_loop(max(next_frame - time.perf_counter(), 0.001))
+        dirty, self.highlighted = self.highlighted, ()
+        self.draw_bars(dirty)
+
+    def finish(self):
+        """Color everything green and hand the bars back to normal drawing."""
+        for bar, text in itertools.zip_longest(self.bars, self.texts):
+            bar.set_color('green')
+            bar.set_animated(False)
+            if text is not None:
+                text.set_color('green')
+                text.set_animated(False)
+        self.canvas.draw_idle()
 
 def start_sorting():
     input_text = entry_numbers.get().strip()
-    if not input_text:
-        messagebox.showerror("Input Error", "Please enter numbers separated by commas.")
-        return
-    
-    try:
-        numbers = list(map(int, input_text.split(',')))
-    except ValueError:
-        messagebox.showerror("Input Error", "Invalid input. Only numbers separated by commas are allowed.")
+    random_count = entry_random.get().strip()
+    if input_text:
+        try:
+            numbers = list(map(int, input_text.split(',')))
+        except ValueError:
+            messagebox.showerror("Input Error", "Invalid input. Only numbers separated by commas are allowed.")
+            return
+    elif random_count.isdigit() and int(random_count) > 0:
+        numbers = generate_input("random", int(random_count), seed=time.time_ns())
+    else:
+        messagebox.showerror("Input Error", "Please enter numbers separated by commas or a random count.")
         return
 
     algorithm = combo_alg.get()
     if not algorithm:
         messagebox.showerror("Selection Error", "Please select a sorting algorithm.")
         return
+    error = check_input(algorithm, numbers)
+    if error:
+        messagebox.showerror("Input Error", error)
+        return
+
+    try:
+        fps = float(entry_fps.get())
+        if fps <= 0:
+            raise ValueError
+    except ValueError:
+        messagebox.showerror("Input Error", "Steps per second must be a positive number.")
+        return
 
     fig, ax = plt.subplots()
-    x_pos = np.arange(len(numbers))
-    global heights
-    heights = numbers.copy()
-    colors = list(plt.cm.tab10.colors[:len(heights)])  # Assign different colors for input bars
-    bars = ax.bar(x_pos, heights, color=colors)
-    texts = [ax.text(i, v + 1, str(v), ha='center', fontsize=10) for i, v in enumerate(heights)]
-    
-    plt.xticks(range(0, len(numbers) + 1, 1))
-    plt.yticks(range(0, max(numbers) + 10, 10))
+    renderer = BarRenderer(ax, numbers, fps)
+
+    if len(numbers) <= 100:
+        plt.xticks(range(0, len(numbers) + 1, 1))
+        plt.yticks(range(min(0, min(numbers)), max(numbers) + 10, 10))
     plt.xlabel("Input Numbers")
     plt.ylabel("Values")
-    plt.title(f"{algorithm} Sort Visualization")
-    plt.ion()
-    plt.show()
+    plt.title(f"{algorithm} Visualization")
+    plt.show(block=False)
 
-    if algorithm == "Bubble Sort":
-        bubble_sort(heights, bars, texts, colors)
-    elif algorithm == "Selection Sort":
-        selection_sort(heights, bars, texts, colors)
-    elif algorithm == "Insertion Sort":
-        insertion_sort(heights, bars, texts, colors)
-
-    for bar, text in zip(bars, texts):
-        bar.set_color('green')
-        text.set_color('green')
-    plt.ioff()
+    # The sort generator is stepped as the frames are drawn
+    renderer.play(SORTS[algorithm](list(numbers)))
+    renderer.finish()
+    plt.title(f"{algorithm}: {renderer.comparisons} comparisons, {renderer.moves} moves")
     plt.show()
 
-# GUI Setup
-root = tk.Tk()
-root.title("Sorting Algorithm Visualizer")
-root.geometry("400x300")
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["bench"]:
+        benchmark_main(sys.argv[2:])
+        sys.exit()
+    if sys.argv[1:2] == ["fast"]:
+        fast_main(sys.argv[2:])
+        sys.exit()
+    if sys.argv[1:2] == ["external"]:
+        external_main(sys.argv[2:])
+        sys.exit()
+
+    # GUI Setup
+    root = tk.Tk()
+    root.title("Sorting Algorithm Visualizer")
+    root.geometry("400x400")
+
+    tk.Label(root, text="Enter numbers (comma-separated):").pack(pady=5)
+    entry_numbers = tk.Entry(root, width=30)
+    entry_numbers.pack(pady=5)
+
+    tk.Label(root, text="Or sort this many random numbers:").pack(pady=5)
+    entry_random = tk.Entry(root, width=8)
+    entry_random.pack(pady=5)
 
-tk.Label(root, text="Enter numbers (comma-separated):").pack(pady=5)
-entry_numbers = tk.Entry(root, width=30)
-entry_numbers.pack(pady=5)
+    tk.Label(root, text="Select Sorting Algorithm:").pack(pady=5)
+    combo_alg = ttk.Combobox(root, values=list(SORTS), state="readonly")
+    combo_alg.pack(pady=5)
 
-tk.Label(root, text="Select Sorting Algorithm:").pack(pady=5)
-combo_alg = ttk.Combobox(root, values=["Bubble Sort", "Selection Sort", "Insertion Sort"], state="readonly")
-combo_alg.pack(pady=5)
+    tk.Label(root, text="Steps per second:").pack(pady=5)
+    entry_fps = tk.Entry(root, width=8)
+    entry_fps.insert(0, "4")
+    entry_fps.pack(pady=5)
 
-tk.Button(root, text="Start Sorting", command=start_sorting).pack(pady=20)
+    tk.Button(root, text="Start Sorting", command=start_sorting).pack(pady=20)
 
-root.mainloop()
+    root.mainloop()
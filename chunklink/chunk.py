@@ -1,15 +1,377 @@
 import hashlib
+import mmap
+from bisect import bisect_right
 import os
+import struct
 import tkinter as tk
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from tkinter import filedialog, scrolledtext, messagebox
 import tempfile
 
+def sha256_many(datas):
+    """Hash a batch of chunks (module level so process pools can pickle it)"""
+    return [hashlib.sha256(data).hexdigest() for data in datas]
+
+def iter_checksums(items, workers=None, use_processes=False, batch_size=64):
+    """Yield (key, data, checksum) for each (key, data) pair, in order.
+
+    With workers > 1 the hashing runs on a thread pool (hashlib releases the
+    GIL on large buffers) or on a process pool, which suits small chunks.
+    Chunks are submitted in batches with a bounded number in flight so
+    memory stays proportional to workers * batch_size.
+    """
+    if not workers or workers < 2:
+        for key, data in items:
+            yield key, data, hashlib.sha256(data).hexdigest()
+        return
+
+    pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        pending = deque()
+        batch = []
+
+        def drain(limit):
+            while len(pending) > limit:
+                done_batch, future = pending.popleft()
+                for (key, data), checksum in zip(done_batch, future.result()):
+                    yield key, data, checksum
+
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                pending.append((batch, pool.submit(sha256_many, [data for _, data in batch])))
+                batch = []
+                yield from drain(workers * 2)
+        if batch:
+            pending.append((batch, pool.submit(sha256_many, [data for _, data in batch])))
+        yield from drain(0)
+
+# Gear table for the content-defined chunker: one pseudo-random 64-bit
+# value per byte, derived deterministically so cut points are stable
+GEAR = [int.from_bytes(hashlib.sha256(bytes([i])).digest()[:8], 'big') for i in range(256)]
+MASK64 = (1 << 64) - 1
+
+def cdc_cut_point(data, start, end, min_size, avg_size, max_size):
+    """Length of the next content-defined chunk in data[start:end].
+
+    FastCDC-style gear hash with normalized chunking: a stricter mask is
+    used before avg_size and a looser one after it, which keeps chunk
+    sizes close to the average. The mask tests the high bits of the
+    fingerprint, which depend on the last 64 bytes.
+    """
+    size = end - start
+    if size <= min_size:
+        return size
+    size = min(size, max_size)
+    bits = max(avg_size.bit_length() - 1, 2)
+    mask_strict = ((1 << (bits + 1)) - 1) << (64 - bits - 1)
+    mask_loose = ((1 << (bits - 1)) - 1) << (64 - bits + 1)
+    normal = min(avg_size, size)
+    fingerprint = 0
+    i = min_size
+    while i < normal:
+        fingerprint = ((fingerprint << 1) + GEAR[data[start + i]]) & MASK64
+        i += 1
+        if not fingerprint & mask_strict:
+            return i
+    while i < size:
+        fingerprint = ((fingerprint << 1) + GEAR[data[start + i]]) & MASK64
+        i += 1
+        if not fingerprint & mask_loose:
+            return i
+    return size
+
+def read_cdc_chunks(f, min_size, avg_size, max_size):
+    """Yield (offset, bytes) content-defined chunks of an open file"""
+    buf = b''
+    pos = 0
+    offset = 0
+    eof = False
+    while True:
+        if not eof and len(buf) - pos < max_size:
+            more = f.read(max(max_size, 65536))
+            eof = not more
+            buf = buf[pos:] + more
+            pos = 0
+        if pos >= len(buf):
+            break
+        cut = cdc_cut_point(buf, pos, len(buf), min_size, avg_size, max_size)
+        yield offset, buf[pos:pos + cut]
+        pos += cut
+        offset += cut
+
+class ChunkStore:
+    """Content-addressed chunk store on disk, keyed by the chunk SHA-256.
+
+    Chunks live under root/<first two hex chars>/<checksum>, so storing a
+    chunk that is already present costs only a stat.
+    """
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, checksum):
+        return os.path.join(self.root, checksum[:2], checksum)
+
+    def __contains__(self, checksum):
+        return os.path.exists(self.path(checksum))
+
+    def put(self, checksum, data):
+        """Store a chunk; returns False if it was already present"""
+        path = self.path(checksum)
+        if os.path.exists(path):
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so a crash never leaves a truncated chunk behind
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        return True
+
+    def get(self, checksum):
+        with open(self.path(checksum), 'rb') as f:
+            return f.read()
+
+class ChunkManifest:
+    """Read-only view of a binary chunk manifest through mmap.
+
+    Layout (little endian): a header with magic, version, chunk size,
+    record count, Merkle root and the source path, followed by fixed-width
+    records of (index, offset, length, SHA-256 digest). Record i is read
+    straight from the mapping, so opening costs nothing per chunk.
+    """
+    MAGIC = b'CHNK'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHHIQ32sH')
+    RECORD = struct.Struct('<QQI32s')
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ValueError(f"Empty manifest: {path}")
+        if len(self.map) < self.HEADER.size:
+            self.close()
+            raise ValueError(f"Truncated manifest: {path}")
+        magic, version, _, self.chunk_size, self.count, root, path_len = self.HEADER.unpack_from(self.map, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"Not a ChunkLink manifest: {path}")
+        self.merkle_root = root.hex() if self.count else None
+        start = self.HEADER.size
+        self.source_path = self.map[start:start + path_len].decode('utf-8')
+        self.records_start = start + path_len
+        if len(self.map) < self.records_start + self.count * self.RECORD.size:
+            self.close()
+            raise ValueError(f"Truncated manifest: {path}")
+
+    @classmethod
+    def write(cls, path, chunklink):
+        """Write the manifest for a split ChunkLink, one record per chunk"""
+        root = bytes.fromhex(chunklink.merkle_root()) if chunklink.nodes else bytes(32)
+        source = chunklink.file_path.encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, chunklink.chunk_size,
+                                    len(chunklink.nodes), root, len(source)))
+            f.write(source)
+            for node in chunklink.nodes:
+                f.write(cls.RECORD.pack(node.index, node.offset, node.length, bytes.fromhex(node.checksum)))
+        return path
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        """(index, offset, length, checksum) of record i"""
+        if not 0 <= i < self.count:
+            raise IndexError("manifest record out of range")
+        index, offset, length, digest = self.RECORD.unpack_from(self.map, self.records_start + i * self.RECORD.size)
+        return index, offset, length, digest.hex()
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def records(self):
+        """All records as raw (index, offset, length, digest) tuples, unpacked in one pass"""
+        end = self.records_start + self.count * self.RECORD.size
+        return self.RECORD.iter_unpack(self.map[self.records_start:end])
+
+    def verify_chunk(self, i, source_path=None):
+        """Hash one chunk of the source file against its record"""
+        _, offset, length, checksum = self[i]
+        with open(source_path or self.source_path, 'rb') as f:
+            f.seek(offset)
+            return hashlib.sha256(f.read(length)).hexdigest() == checksum
+
+    def validate(self, source_path=None, workers=None, use_processes=False):
+        """Indices of chunks in the source file that no longer match the manifest.
+
+        The source is read once sequentially and compared with the stored
+        digests, so no split or linking pass is needed first.
+        """
+        with open(source_path or self.source_path, 'rb') as f:
+            def chunks():
+                for index, offset, length, _ in self:
+                    f.seek(offset)
+                    yield index, f.read(length)
+            return [index for index, _, checksum in iter_checksums(chunks(), workers, use_processes)
+                    if checksum != self[index][3]]
+
+    def close(self):
+        if getattr(self, 'map', None) is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class MerkleTree:
+    """Binary hash tree over chunk checksums.
+
+    levels[0] holds the leaf digests and levels[-1] the root. A node without
+    a sibling is promoted unchanged to the next level.
+    """
+    def __init__(self, checksums):
+        self.levels = [[bytes.fromhex(c) for c in checksums]]
+        self.build()
+
+    @classmethod
+    def from_digests(cls, digests):
+        """Tree over raw leaf digests, skipping the hex round trip"""
+        tree = cls([])
+        tree.levels = [list(digests)]
+        tree.build()
+        return tree
+
+    def build(self):
+        sha256 = hashlib.sha256
+        while len(self.levels[-1]) > 1:
+            below = self.levels[-1]
+            level = [sha256(left + right).digest() for left, right in zip(below[::2], below[1::2])]
+            if len(below) % 2:
+                level.append(below[-1])  # Promoted unchanged, as in parent_digest
+            self.levels.append(level)
+
+    @staticmethod
+    def parent_digest(level, i):
+        if i + 1 < len(level):
+            return hashlib.sha256(level[i] + level[i + 1]).digest()
+        return level[i]
+
+    def copy(self):
+        tree = MerkleTree([])
+        tree.levels = [level[:] for level in self.levels]
+        return tree
+
+    @property
+    def root_hash(self):
+        return self.levels[-1][0].hex() if self.levels[0] else None
+
+    def update_leaf(self, index, checksum):
+        """Replace one leaf and rehash its path to the root (O(log n))"""
+        self.levels[0][index] = bytes.fromhex(checksum)
+        for depth in range(1, len(self.levels)):
+            index //= 2
+            self.levels[depth][index] = self.parent_digest(self.levels[depth - 1], index * 2)
+
+    def proof(self, index):
+        """Inclusion proof for a leaf as a list of (sibling_hash, sibling_is_left)"""
+        path = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                path.append((level[sibling].hex(), sibling < index))
+            index //= 2
+        return path
+
+    @staticmethod
+    def verify_proof(checksum, proof, root_hash):
+        digest = bytes.fromhex(checksum)
+        for sibling, sibling_is_left in proof:
+            sibling = bytes.fromhex(sibling)
+            pair = sibling + digest if sibling_is_left else digest + sibling
+            digest = hashlib.sha256(pair).digest()
+        return digest.hex() == root_hash
+
+    def diff(self, other):
+        """Leaf indices that differ from another tree of the same shape.
+
+        Only subtrees whose hashes differ are descended into, so k bad
+        leaves cost O(k log n) comparisons.
+        """
+        if len(self.levels[0]) != len(other.levels[0]):
+            raise ValueError("Merkle trees cover a different number of chunks")
+        if not self.levels[0]:
+            return []
+        suspects = [0]
+        for depth in range(len(self.levels) - 1, -1, -1):
+            mine, theirs = self.levels[depth], other.levels[depth]
+            mismatched = [i for i in suspects if mine[i] != theirs[i]]
+            if depth == 0:
+                return mismatched
+            below = len(self.levels[depth - 1])
+            suspects = [c for i in mismatched for c in (2 * i, 2 * i + 1) if c < below]
+        return []
+
 class ChunkNode:
-    def __init__(self, index, data):
+    def __init__(self, index, data, offset=0, length=None, source_path=None):
         self.index = index
-        self.data = data
+        self._data = data  # None for lazy (streaming) chunks
+        self.offset = offset
+        self.length = len(data) if data is not None else length
+        self.source_path = source_path
+        self.checksum = None
         self.next_checksum = None
         self.next_node = None
+
+    @property
+    def data(self):
+        """Chunk bytes, read from the source file if the chunk is lazy"""
+        return self.read()
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self.length = len(value)
+
+    def read(self, source=None):
+        """Return the chunk bytes, reusing an open source file if given"""
+        if self._data is not None:
+            return self._data
+        if source is None:
+            with open(self.source_path, 'rb') as f:
+                return self.read(f)
+        source.seek(self.offset)
+        return source.read(self.length)
+
+    def iter_data(self, source=None, buffer_size=65536):
+        """Yield the chunk bytes in pieces of at most buffer_size"""
+        if self._data is not None:
+            yield self._data
+            return
+        if source is None:
+            with open(self.source_path, 'rb') as f:
+                yield from self.iter_data(f, buffer_size)
+            return
+        source.seek(self.offset)
+        remaining = self.length
+        while remaining > 0:
+            piece = source.read(min(buffer_size, remaining))
+            if not piece:
+                break
+            remaining -= len(piece)
+            yield piece
         
     def compute_checksum(self, data):
         return hashlib.sha256(data).hexdigest()
@@ -18,52 +380,224 @@ class ChunkLink:
     def __init__(self):
         self.head = None
         self.chunk_size = 1024  # Default 1KB chunks
+        self.file_path = None
+        self.source_path = None  # Set when chunks are read lazily
+        self.nodes = []
+        self.offsets = []
+        self.merkle = None  # Tree over the checksums recorded at split time
+        self.current_tree = None  # Tree kept up to date by update_chunk, copied on first edit
+        self.dedup_stats = None  # Set by split_file when a ChunkStore is used
+
+    def open_source(self):
+        """Open the source file of lazy chunks (no-op for in-memory chains)"""
+        if self.source_path:
+            return open(self.source_path, 'rb')
+        return nullcontext()
+        
+    def read_chunks(self, f):
+        """Yield (offset, bytes) for each fixed-size chunk of an open file"""
+        offset = 0
+        while True:
+            chunk = f.read(self.chunk_size)
+            if not chunk:
+                break
+            yield offset, chunk
+            offset += len(chunk)
         
-    def split_file(self, file_path, chunk_size=1024):
+    def split_file(self, file_path, chunk_size=1024, streaming=False, workers=None, use_processes=False,
+                   content_defined=False, min_size=None, max_size=None, store=None):
+        """Split a file into linked chunks.
+
+        With streaming=True only the chunk metadata (offset, length,
+        checksum) is kept and the data is re-read from file_path on demand.
+        With workers > 1 the chunk checksums are computed on a worker pool.
+        With content_defined=True chunk boundaries come from a rolling hash,
+        averaging chunk_size bytes (min_size and max_size default to a
+        quarter and four times that), so an insertion only changes the
+        chunks around it. If a ChunkStore is given, new chunks are written
+        to it and self.dedup_stats reports how much was already stored.
+        """
         self.chunk_size = chunk_size
         self.head = None
+        self.file_path = file_path
+        self.source_path = file_path if streaming else None
         nodes = []
+        total_bytes = stored_bytes = new_chunks = 0
         
         with open(file_path, 'rb') as f:
-            index = 0
-            while True:
-                chunk = f.read(self.chunk_size)
-                if not chunk:
-                    break
-                node = ChunkNode(index, chunk)
+            if content_defined:
+                min_size = min_size or max(chunk_size // 4, 1)
+                max_size = max_size or chunk_size * 4
+                if not min_size <= chunk_size <= max_size:
+                    raise ValueError("Chunk sizes must satisfy min_size <= chunk_size <= max_size")
+                chunks = read_cdc_chunks(f, min_size, chunk_size, max_size)
+            else:
+                chunks = self.read_chunks(f)
+            for index, (offset, chunk, checksum) in enumerate(iter_checksums(chunks, workers, use_processes)):
+                if streaming:
+                    node = ChunkNode(index, None, offset, len(chunk), file_path)
+                else:
+                    node = ChunkNode(index, chunk, offset)
+                node.checksum = checksum
                 nodes.append(node)
-                index += 1
+                total_bytes += len(chunk)
+                if store is not None and store.put(checksum, chunk):
+                    new_chunks += 1
+                    stored_bytes += len(chunk)
+
+        if store is not None:
+            self.dedup_stats = {
+                "chunks": len(nodes),
+                "new_chunks": new_chunks,
+                "total_bytes": total_bytes,
+                "stored_bytes": stored_bytes,
+                # Logical bytes per byte actually written to the store
+                "dedup_ratio": total_bytes / stored_bytes if stored_bytes else float('inf'),
+            }
                 
-        # Link nodes and set checksums
+        return self.link_nodes(nodes)
+
+    def link_nodes(self, nodes, merkle=None):
+        """Link nodes, set their next checksums and build the Merkle index (unless given)"""
         for i in range(len(nodes)-1):
             nodes[i].next_node = nodes[i+1]
-            nodes[i].next_checksum = nodes[i].compute_checksum(nodes[i+1].data)
+            nodes[i].next_checksum = nodes[i+1].checksum
             
         self.head = nodes[0] if nodes else None
+        self.nodes = nodes
+        self.offsets = [node.offset for node in nodes]  # Sorted chunk start offsets for read()
+        self.merkle = merkle or MerkleTree([node.checksum for node in nodes])
+        self.current_tree = None
         return nodes
+
+    def save_manifest(self, path):
+        """Save the chunk metadata as a binary manifest (see ChunkManifest)"""
+        if not self.file_path:
+            raise ValueError("No file has been split")
+        return ChunkManifest.write(path, self)
+
+    def load_manifest(self, path, source_path=None):
+        """Rebuild a streaming chain from a manifest without rehashing the source.
+
+        The Merkle tree is rebuilt from the stored digests and must match the
+        root in the manifest header, otherwise ValueError is raised.
+        """
+        with ChunkManifest(path) as manifest:
+            chunk_size, root = manifest.chunk_size, manifest.merkle_root
+            source_path = source_path or manifest.source_path
+            nodes, digests = [], []
+            for index, offset, length, digest in manifest.records():
+                node = ChunkNode(index, None, offset, length, source_path)
+                node.checksum = digest.hex()
+                nodes.append(node)
+                digests.append(digest)
+        merkle = MerkleTree.from_digests(digests)
+        if merkle.root_hash != root:
+            raise ValueError(f"Manifest {path} is corrupted: Merkle root does not match its records")
+        self.chunk_size = chunk_size
+        self.source_path = self.file_path = source_path
+        return self.link_nodes(nodes, merkle)
+
+    def working_tree(self):
+        """Tree tracking edits, copied from the split-time tree on first use"""
+        if self.current_tree is None:
+            self.current_tree = self.merkle.copy()
+        return self.current_tree
+
+    def read(self, offset, length, verify=True):
+        """Return length bytes starting at offset as a memoryview.
+
+        Only the chunks overlapping the range are fetched (found by binary
+        search over chunk offsets) and, with verify=True, checked against
+        their split-time checksums. A range inside a single chunk is a
+        zero-copy slice of that chunk.
+        """
+        if offset < 0 or length < 0:
+            raise ValueError("Offset and length must be non-negative")
+        if not self.nodes or length == 0:
+            return memoryview(b'')
+        first = max(bisect_right(self.offsets, offset) - 1, 0)
+        end = offset + length
+        pieces = []
+        with self.open_source() as source:
+            for i in range(first, len(self.nodes)):
+                node = self.nodes[i]
+                if node.offset >= end:
+                    break
+                data = node.read(source)
+                if verify and node.compute_checksum(data) != node.checksum:
+                    raise ValueError(f"Chunk {node.index} is corrupted")
+                start = max(offset - node.offset, 0)
+                stop = min(end - node.offset, len(data))
+                if start < stop:
+                    pieces.append(memoryview(data)[start:stop])
+        if len(pieces) == 1:
+            return pieces[0]
+        return memoryview(b''.join(pieces))
+
+    def merkle_root(self):
+        return self.merkle.root_hash if self.merkle else None
+
+    def chunk_proof(self, index):
+        return self.merkle.proof(index)
+
+    def verify_chunk(self, index):
+        """Check one chunk against the recorded Merkle root in O(log n) hashes"""
+        node = self.nodes[index]
+        checksum = node.compute_checksum(node.data)
+        return MerkleTree.verify_proof(checksum, self.merkle.proof(index), self.merkle.root_hash)
+
+    def update_chunk(self, index, data):
+        """Replace a chunk's data (edit, corruption or repair) and rehash its Merkle path"""
+        node = self.nodes[index]
+        node.data = data
+        self.working_tree().update_leaf(index, node.compute_checksum(data))
+
+    def find_corrupted_chunks(self, rescan=False, workers=None, use_processes=False):
+        """Indices of chunks whose data no longer matches the split-time checksums.
+
+        Edits made through update_chunk are already reflected in the current
+        tree, so the query only descends into mismatching subtrees. Use
+        rescan=True to rehash every chunk, e.g. after the source file of a
+        streaming chain changed on disk.
+        """
+        if not self.merkle:
+            return []
+        if rescan:
+            with self.open_source() as source:
+                chunks = ((node, node.read(source)) for node in self.nodes)
+                checksums = [checksum for _, _, checksum in iter_checksums(chunks, workers, use_processes)]
+            self.current_tree = MerkleTree(checksums)
+        if self.current_tree is None:
+            return []  # No edits since the split
+        return self.merkle.diff(self.current_tree)
     
-    def validate_chain(self):
+    def iter_links(self, source=None):
+        """Yield (node, next chunk bytes) for every link in the chain"""
         current = self.head
         while current and current.next_node:
-            actual_checksum = current.compute_checksum(current.next_node.data)
-            if actual_checksum != current.next_checksum:
-                return False
+            yield current, current.next_node.read(source)
             current = current.next_node
+    
+    def validate_chain(self, workers=None, use_processes=False):
+        with self.open_source() as source:
+            links = self.iter_links(source)
+            for current, _, actual_checksum in iter_checksums(links, workers, use_processes):
+                if actual_checksum != current.next_checksum:
+                    return False
         return True
     
-    def reconstruct_file(self, output_path):
+    def reconstruct_file(self, output_path, buffer_size=65536):
+        """Write the chunks to output_path one buffer at a time"""
         if not self.head:
             raise ValueError("No chunks to reconstruct")
             
-        current = self.head
-        full_data = bytearray()
-        
-        while current:
-            full_data.extend(current.data)
-            current = current.next_node
-            
-        with open(output_path, 'wb') as f:
-            f.write(full_data)
+        with self.open_source() as source, open(output_path, 'wb') as f:
+            current = self.head
+            while current:
+                for piece in current.iter_data(source, buffer_size):
+                    f.write(piece)
+                current = current.next_node
         return output_path
 
 class ChunkLinkGUI:
@@ -101,6 +635,16 @@ class ChunkLinkGUI:
         self.corrupt_button = tk.Button(self.frame, text="Simulate Corruption", command=self.simulate_corruption)
         self.corrupt_button.grid(row=0, column=5, padx=5)
         
+        # Streaming mode keeps only chunk metadata in memory
+        self.streaming_var = tk.BooleanVar(value=False)
+        self.streaming_check = tk.Checkbutton(self.frame, text="Streaming (low memory)", variable=self.streaming_var)
+        self.streaming_check.grid(row=0, column=6, padx=5)
+        
+        # Rolling-hash boundaries instead of fixed-size chunks
+        self.cdc_var = tk.BooleanVar(value=False)
+        self.cdc_check = tk.Checkbutton(self.frame, text="Content-defined", variable=self.cdc_var)
+        self.cdc_check.grid(row=0, column=7, padx=5)
+        
         # Info Display
         self.info_display = scrolledtext.ScrolledText(self.frame, width=80, height=20)
         self.info_display.grid(row=1, column=0, columnspan=3, pady=10)
@@ -117,7 +661,8 @@ class ChunkLinkGUI:
                 chunk_size = 1024
                 
             self.current_file = file_path
-            nodes = self.chunklink.split_file(file_path, chunk_size)
+            nodes = self.chunklink.split_file(file_path, chunk_size, streaming=self.streaming_var.get(),
+                                              content_defined=self.cdc_var.get())
             self.update_display()
             messagebox.showinfo("Success", f"File split into {len(nodes)} chunks!")
             
@@ -155,7 +700,7 @@ class ChunkLinkGUI:
 
     def simulate_corruption(self):
         if self.chunklink.head and self.chunklink.head.next_node:
-            self.chunklink.head.next_node.data = b"CORRUPTED_DATA"
+            self.chunklink.update_chunk(1, b"CORRUPTED_DATA")
             self.update_display()
 
     def full_validation(self):
@@ -192,6 +737,8 @@ class ChunkLinkGUI:
         result = []
         result.append(f"Chain Integrity: {'Valid' if chain_valid else 'Invalid'}")
         result.append(f"File Integrity: {'Matched' if file_valid else 'Mismatched'}")
+        result.append(f"Corrupted Chunks: {self.chunklink.find_corrupted_chunks() or 'None'}")
+        result.append(f"Merkle Root: {self.chunklink.merkle_root()}")
         result.append(f"Original Hash: {original_hash}")
         result.append(f"Reconstructed Hash: {reconstructed_hash}")
         
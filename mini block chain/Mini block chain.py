@@ -1,23 +1,448 @@
 import hashlib
+import heapq
+import itertools
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+import time
+import zlib
 import tkinter as tk
+from collections.abc import MutableSequence
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
 from tkinter import scrolledtext, messagebox
 
+def mining_prefix(index, timestamp, data, previous_hash, difficulty):
+    """Everything a mined block hashes before its nonce."""
+    return f"{index}{timestamp}{data}{previous_hash} {difficulty} "
+
+def hash_block(index, timestamp, data, previous_hash, difficulty=0, nonce=0):
+    if difficulty:
+        # Mined blocks also commit to their difficulty and nonce
+        block_contents = f"{mining_prefix(index, timestamp, data, previous_hash, difficulty)}{nonce}"
+    else:
+        block_contents = f"{index}{timestamp}{data}{previous_hash}"
+    return hashlib.sha256(block_contents.encode()).hexdigest()
+
+def meets_difficulty(block_hash, difficulty):
+    """Proof of work: the hash starts with `difficulty` zero hex digits."""
+    return block_hash.startswith("0" * difficulty)
+
+def audit_range(blocks, previous_hash):
+    """Check a run of (index, timestamp, data, previous_hash, difficulty, nonce, hash) tuples.
+
+    previous_hash is the hash of the block before the run. Returns the
+    position in `blocks` of the first invalid block, or None.
+    """
+    for i, (index, timestamp, data, prev, difficulty, nonce, block_hash) in enumerate(blocks):
+        if (block_hash != hash_block(index, timestamp, data, prev, difficulty, nonce)
+                or not meets_difficulty(block_hash, difficulty) or prev != previous_hash):
+            return i
+        previous_hash = block_hash
+    return None
+
+# Proof-of-work mining
+STOP_EVENT = None  # Set in pool workers; tells running searches to give up
+
+def set_stop_event(event):
+    global STOP_EVENT
+    STOP_EVENT = event
+
+def search_nonces(prefix, target, start, stop):
+    """Try nonces in [start, stop) until a hash digest is below target.
+
+    Returns (nonce or None, hashes tried, seconds spent).
+    """
+    began = time.perf_counter()
+    base = hashlib.sha256(prefix.encode())  # Hash the prefix once, copy it per nonce
+    for nonce in range(start, stop):
+        h = base.copy()
+        h.update(str(nonce).encode())
+        if h.digest() < target:
+            return nonce, nonce - start + 1, time.perf_counter() - began
+        if not nonce & 0xFFF and STOP_EVENT is not None and STOP_EVENT.is_set():
+            return None, nonce - start + 1, time.perf_counter() - began
+    return None, stop - start, time.perf_counter() - began
+
+class Miner:
+    """Searches for proof-of-work nonces in batches over a process pool.
+
+    Batches of batch_size consecutive nonces are handed out, two per worker
+    in flight. Once one batch finds a nonce, the queued batches are
+    cancelled and the running ones stop at their next check of the shared
+    event. With one worker the search runs in this process.
+    """
+    def __init__(self, workers=None, batch_size=100_000):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.executor = None
+        self.stop_event = None
+
+    def mine(self, prefix, difficulty):
+        """Find a nonce for which sha256(prefix + nonce) has `difficulty` leading zero hex digits.
+
+        Returns (nonce, stats). stats has hashes, seconds, hashes_per_second
+        and per_core, the hash rate per busy worker.
+        """
+        if not 0 < difficulty <= 64:
+            raise ValueError("difficulty must be between 1 and 64")
+        target = (1 << (256 - 4 * difficulty)).to_bytes(32, 'big')
+        batches = itertools.count(0, self.batch_size)
+        nonce = None
+        hashes = busy = 0
+        began = time.perf_counter()
+        if self.workers == 1:
+            while nonce is None:
+                start = next(batches)
+                nonce, tried, seconds = search_nonces(prefix, target, start, start + self.batch_size)
+                hashes += tried
+                busy += seconds
+        else:
+            if self.executor is None:
+                self.stop_event = multiprocessing.Event()
+                self.executor = ProcessPoolExecutor(self.workers, initializer=set_stop_event,
+                                                    initargs=(self.stop_event,))
+            self.stop_event.clear()
+            pending = set()
+            while nonce is None:
+                while len(pending) < 2 * self.workers:
+                    start = next(batches)
+                    pending.add(self.executor.submit(search_nonces, prefix, target,
+                                                     start, start + self.batch_size))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found, tried, seconds = future.result()
+                    hashes += tried
+                    busy += seconds
+                    if found is not None and (nonce is None or found < nonce):
+                        nonce = found
+            # Early cancellation; wait for the running batches so they don't
+            # overlap with the next search
+            self.stop_event.set()
+            for future in pending:
+                if not future.cancel():
+                    _, tried, seconds = future.result()
+                    hashes += tried
+                    busy += seconds
+        elapsed = time.perf_counter() - began
+        return nonce, {
+            "workers": self.workers,
+            "hashes": hashes,
+            "seconds": elapsed,
+            "hashes_per_second": hashes / elapsed if elapsed else 0.0,
+            "per_core": hashes / busy if busy else 0.0,
+        }
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
 class Block:
-    def __init__(self, index, timestamp, data, previous_hash):
+    HASHED_FIELDS = ("index", "timestamp", "data", "previous_hash", "difficulty", "nonce", "hash")
+
+    def __init__(self, index, timestamp, data, previous_hash, block_hash=None, difficulty=0, nonce=0):
         self.index = index
         self.timestamp = timestamp
         self.data = data
         self.previous_hash = previous_hash
-        self.hash = self.compute_hash()
+        self.difficulty = difficulty
+        self.nonce = nonce
+        # Blocks loaded from disk keep their stored hash; validation rechecks it
+        self.hash = block_hash if block_hash is not None else self.compute_hash()
     
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Let the owning chain know a verified block was changed
+        if name in self.HASHED_FIELDS and self.__dict__.get("on_change"):
+            self.on_change()
+
     def compute_hash(self):
-        block_contents = f"{self.index}{self.timestamp}{self.data}{self.previous_hash}"
-        return hashlib.sha256(block_contents.encode()).hexdigest()
+        return hash_block(self.index, self.timestamp, self.data, self.previous_hash,
+                          self.difficulty, self.nonce)
+
+    def mine(self, difficulty, miner):
+        """Set difficulty, search a nonce that meets it and rehash. Returns the mining stats."""
+        self.difficulty = difficulty
+        prefix = mining_prefix(self.index, self.timestamp, self.data, self.previous_hash, difficulty)
+        self.nonce, stats = miner.mine(prefix, difficulty)
+        self.hash = self.compute_hash()
+        return stats
+
+class BlockList(MutableSequence):
+    """In-memory chain list that reports every change to its blocks.
+
+    on_change is called with the lowest position whose block was replaced,
+    inserted or removed, or changed through its fields.
+    """
+    def __init__(self, blocks=(), on_change=None):
+        self.on_change = on_change
+        self.blocks = []
+        self.extend(blocks)
+
+    def track(self, start, stop=None):
+        """Point the blocks from start on at their current positions."""
+        for i in range(start, len(self.blocks) if stop is None else stop):
+            self.blocks[i].on_change = lambda i=i: self.changed(i)
+
+    def changed(self, position):
+        if self.on_change:
+            self.on_change(position)
+
+    def first(self, i):
+        """Lowest position an index or slice refers to."""
+        if isinstance(i, slice):
+            return min(range(*i.indices(len(self.blocks))), default=len(self.blocks))
+        return i + len(self.blocks) if i < 0 else i
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __getitem__(self, i):
+        return self.blocks[i]
+
+    def __setitem__(self, i, block):
+        start = self.first(i)
+        self.blocks[i] = block
+        # A slice can change the length and shift the blocks after it
+        self.track(start, None if isinstance(i, slice) else start + 1)
+        self.changed(start)
+
+    def __delitem__(self, i):
+        start = self.first(i)
+        del self.blocks[i]
+        self.track(start)
+        self.changed(start)
+
+    def insert(self, i, block):
+        start = min(max(self.first(i), 0), len(self.blocks))
+        self.blocks.insert(i, block)
+        self.track(start)
+        self.changed(start)
+
+class BlockLog:
+    """Append-only file of blocks that behaves like the chain list.
+
+    Each block is one binary record in the log file:
+        <II         payload length, crc32 of the payload
+        <Q32s32sBQH index, hash, previous hash (raw sha256 digests),
+                    difficulty, nonce, timestamp length
+        timestamp, then data, both utf-8
+    The index file (path + ".idx") has one <32sQ entry per block, its hash
+    and log offset, in index order. Block i is found at i * ENTRY.size.
+    The hash index (path + ".hidx") has <32sQ entries of hash and block
+    index sorted by hash, binary searched by find(). It covers the first
+    blocks; the ones appended since are scanned in the index file until
+    more than HASH_TAIL of them are merged in.
+
+    Appends are fsync'd, the log before the index. Opening only maps the
+    files; blocks are decoded each time they are accessed. Only blocks that
+    were changed in memory (like the GUI's tampering) are kept, so their
+    changes stay visible. A torn record at the end of the log is cut off,
+    and a missing index tail is rebuilt.
+    """
+    HEADER = struct.Struct('<II')
+    RECORD = struct.Struct('<Q32s32sBQH')
+    ENTRY = struct.Struct('<32sQ')
+    HASH_TAIL = 1024
+
+    def __init__(self, path, on_change=None):
+        self.path = path
+        self.on_change = on_change  # Called with the position of a changed block
+        self.log = open(path, 'a+b')
+        self.index_file = open(path + ".idx", 'a+b')
+        self.log_map = None
+        self.index_map = None
+        self.hash_map = None
+        self.blocks = {}  # position -> block, for changed blocks only
+        self.recover()
+        self.map_hashes()
+
+    def recover(self):
+        """Bring the index in line with the log after a crash."""
+        log_size = os.fstat(self.log.fileno()).st_size
+        count = os.fstat(self.index_file.fileno()).st_size // self.ENTRY.size
+        self.index_file.truncate(count * self.ENTRY.size)
+        self.remap()
+        end = 0
+        if count:
+            _, offset = self.entry(count - 1)
+            end = offset + self.HEADER.size + self.HEADER.unpack_from(self.log_map, offset)[0]
+        self.count = count
+
+        # Index records that made it to the log but not the index
+        entries = []
+        while end + self.HEADER.size <= log_size:
+            length, crc = self.HEADER.unpack_from(self.log_map, end)
+            payload = self.log_map[end + self.HEADER.size:end + self.HEADER.size + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break
+            entries.append(self.ENTRY.pack(self.RECORD.unpack_from(payload)[1], end))
+            end += self.HEADER.size + length
+        if end < log_size:
+            self.log_map = None  # Unmap before truncating the torn tail
+            self.log.truncate(end)
+        if entries:
+            self.index_file.write(b"".join(entries))
+            self.sync(self.index_file)
+            self.count += len(entries)
+        self.remap()
+
+    def remap(self):
+        """Map both files again, after they grew."""
+        for name, f in (("log_map", self.log), ("index_map", self.index_file)):
+            f.flush()
+            size = os.fstat(f.fileno()).st_size
+            setattr(self, name, mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) if size else None)
+
+    def sync(self, f):
+        f.flush()
+        os.fsync(f.fileno())
+
+    def entry(self, i):
+        """(hash digest, log offset) of block i."""
+        return self.ENTRY.unpack_from(self.index_map, i * self.ENTRY.size)
+
+    def load(self, i):
+        offset = self.entry(i)[1]
+        length, _ = self.HEADER.unpack_from(self.log_map, offset)
+        start = offset + self.HEADER.size
+        index, block_hash, previous_hash, difficulty, nonce, ts_length = self.RECORD.unpack_from(self.log_map, start)
+        text = self.log_map[start + self.RECORD.size:start + length].decode()
+        timestamp = text[:ts_length]
+        try:
+            timestamp = datetime.fromisoformat(timestamp)
+        except ValueError:
+            pass  # Hashing uses str(timestamp), so the string works as well
+        return Block(index, timestamp, text[ts_length:],
+                     previous_hash.hex() if index else "0", block_hash.hex(), difficulty, nonce)
+
+    def track(self, i, block):
+        """Keep block in memory as block i once it is changed."""
+        def changed():
+            self.blocks[i] = block
+            if self.on_change:
+                self.on_change(i)
+        block.on_change = changed
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.count))]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("block index out of range")
+        block = self.blocks.get(i)
+        if block is None:
+            block = self.load(i)
+            self.track(i, block)
+        return block
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def map_hashes(self):
+        """Map the hash index; one that covers more blocks than the log is dropped."""
+        self.hash_map = None
+        try:
+            with open(self.path + ".hidx", 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size:
+                    self.hash_map = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            size = 0
+        self.hashed = size // self.ENTRY.size
+        if self.hashed > self.count:
+            self.hash_map, self.hashed = None, 0
+
+    def merge_hashes(self):
+        """Merge the blocks appended since into the hash index file."""
+        tail = sorted((self.entry(i)[0], i) for i in range(self.hashed, self.count))
+        indexed = (self.ENTRY.unpack_from(self.hash_map, k * self.ENTRY.size) for k in range(self.hashed))
+        temp = self.path + ".hidx.tmp"
+        with open(temp, 'wb') as f:
+            f.writelines(self.ENTRY.pack(*e) for e in heapq.merge(indexed, tail))
+        self.hash_map = None  # Unmap before replacing the file
+        os.replace(temp, self.path + ".hidx")
+        self.map_hashes()
+
+    def find(self, block_hash):
+        """The block with this hash, or None."""
+        if self.count - self.hashed > self.HASH_TAIL:
+            self.merge_hashes()
+        digest = bytes.fromhex(block_hash)
+        low, high = 0, self.hashed
+        while low < high:
+            middle = (low + high) // 2
+            entry_hash, i = self.ENTRY.unpack_from(self.hash_map, middle * self.ENTRY.size)
+            if entry_hash == digest:
+                return self[i]
+            if entry_hash < digest:
+                low = middle + 1
+            else:
+                high = middle
+        for i in range(self.hashed, self.count):
+            if self.entry(i)[0] == digest:
+                return self[i]
+        return None
+
+    def append(self, block):
+        timestamp = str(block.timestamp).encode()
+        previous_hash = bytes.fromhex(block.previous_hash) if block.index else bytes(32)
+        payload = (self.RECORD.pack(block.index, bytes.fromhex(block.hash), previous_hash,
+                                    block.difficulty, block.nonce, len(timestamp))
+                   + timestamp + block.data.encode())
+        offset = os.fstat(self.log.fileno()).st_size
+        self.log.write(self.HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        self.sync(self.log)
+        self.index_file.write(self.ENTRY.pack(bytes.fromhex(block.hash), offset))
+        self.sync(self.index_file)
+
+        self.track(self.count, block)
+        self.count += 1
+        self.remap()
+
+    def close(self):
+        self.log_map = self.index_map = self.hash_map = None
+        self.log.close()
+        self.index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
 class Blockchain:
-    def __init__(self):
-        self.chain = [self.create_genesis_block()]
+    def __init__(self, path=None, difficulty=0, workers=None):
+        # New blocks are mined when difficulty > 0, on `workers` processes
+        self.difficulty = difficulty
+        self.miner = Miner(workers)
+        self.mining_stats = None  # Stats of the last mined block
+        # Blocks 0..verified have been checked; validation resumes after them
+        self.verified = 0
+        # With a path the chain is kept in a BlockLog and survives restarts
+        if path is None:
+            self.chain = BlockList([self.create_genesis_block()], on_change=self.invalidate)
+        else:
+            self.chain = BlockLog(path, on_change=self.invalidate)
+            if not len(self.chain):
+                self.chain.append(self.create_genesis_block())
+
+    def invalidate(self, position):
+        # The block itself and the link from the next one need rechecking
+        self.verified = min(self.verified, max(position - 1, 0))
+
+    def close(self):
+        self.miner.close()
+        if isinstance(self.chain, BlockLog):
+            self.chain.close()
     
     def create_genesis_block(self):
         # Manually create first block with arbitrary values
@@ -34,28 +459,66 @@ class Blockchain:
             data=new_data,
             previous_hash=previous_block.hash
         )
+        self.mining_stats = new_block.mine(self.difficulty, self.miner) if self.difficulty else None
         self.chain.append(new_block)
     
-    def validate_chain(self):
-        for i in range(1, len(self.chain)):
+    def validate_chain(self, full=False, workers=None):
+        """Check block hashes and links.
+
+        By default only blocks after the verified checkpoint are checked, so
+        validating after add_block costs O(new blocks). Changing a block moves
+        the checkpoint back before it. full=True rechecks the whole chain,
+        split into ranges over `workers` processes when workers > 1.
+        """
+        if full:
+            self.verified = 0
+            if workers and workers > 1:
+                return self.audit(workers)
+        # Blocks may have been removed from below the checkpoint
+        self.verified = max(min(self.verified, len(self.chain) - 1), 0)
+        previous_block = self.chain[self.verified]
+        for i in range(self.verified + 1, len(self.chain)):
             current_block = self.chain[i]
-            previous_block = self.chain[i-1]
             
             # Check if current block hash is valid
             if current_block.hash != current_block.compute_hash():
                 return False
             
+            # Check the proof of work of mined blocks
+            if not meets_difficulty(current_block.hash, current_block.difficulty):
+                return False
+            
             # Check if previous hash matches
             if current_block.previous_hash != previous_block.hash:
                 return False
+            self.verified = i
+            previous_block = current_block
+        return True
+
+    def audit(self, workers, ranges_per_worker=4):
+        """Full validation with block ranges hashed on a process pool."""
+        blocks = [(b.index, str(b.timestamp), b.data, b.previous_hash, b.difficulty, b.nonce, b.hash)
+                  for b in self.chain]
+        step = max(1, -(-(len(blocks) - 1) // (workers * ranges_per_worker)))
+        starts = range(1, len(blocks), step)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(audit_range, [blocks[s:s + step] for s in starts],
+                                   [blocks[s - 1][-1] for s in starts])
+            for start, bad in zip(starts, results):
+                if bad is not None:
+                    self.verified = start + bad - 1
+                    return False
+        self.verified = len(blocks) - 1
         return True
 
 class BlockchainGUI:
-    def __init__(self, master):
+    DISPLAY_LIMIT = 100  # Only the latest blocks are listed
+
+    def __init__(self, master, path=None):
         self.master = master
         master.title("Mini Blockchain Explorer")
         
-        self.blockchain = Blockchain()
+        self.blockchain = Blockchain(path)
         
         # Create GUI elements
         self.frame = tk.Frame(master, padx=10, pady=10)
@@ -76,6 +539,16 @@ class BlockchainGUI:
         self.tamper_button = tk.Button(self.frame, text="Tamper with Block 1", command=self.tamper_block)
         self.tamper_button.grid(row=1, column=1, pady=5)
         
+        self.audit_button = tk.Button(self.frame, text="Full Audit", command=self.audit_chain)
+        self.audit_button.grid(row=1, column=2, pady=5)
+        
+        self.difficulty_label = tk.Label(self.frame, text="Mining Difficulty:")
+        self.difficulty_label.grid(row=3, column=0, sticky=tk.W)
+        
+        self.difficulty_entry = tk.Entry(self.frame, width=5)
+        self.difficulty_entry.insert(0, "0")
+        self.difficulty_entry.grid(row=3, column=1, sticky=tk.W, padx=5)
+        
         self.chain_display = scrolledtext.ScrolledText(self.frame, width=60, height=15)
         self.chain_display.grid(row=2, column=0, columnspan=3, pady=10)
         
@@ -83,11 +556,26 @@ class BlockchainGUI:
     
     def add_block(self):
         data = self.data_entry.get()
+        try:
+            difficulty = int(self.difficulty_entry.get())
+            if not 0 <= difficulty <= 64:
+                raise ValueError
+        except ValueError:
+            messagebox.showwarning("Input Error", "Difficulty must be a number from 0 to 64")
+            return
         if data:
+            self.blockchain.difficulty = difficulty
             self.blockchain.add_block(data)
             self.data_entry.delete(0, tk.END)
             self.update_display()
-            messagebox.showinfo("Success", "Block added successfully!")
+            stats = self.blockchain.mining_stats
+            if difficulty and stats:
+                messagebox.showinfo("Success",
+                    f"Block mined in {stats['seconds']:.2f} s\n"
+                    f"{stats['hashes']} hashes, {stats['hashes_per_second'] / 1000:.0f} kH/s, "
+                    f"{stats['per_core'] / 1000:.0f} kH/s per core")
+            else:
+                messagebox.showinfo("Success", "Block added successfully!")
         else:
             messagebox.showwarning("Input Error", "Please enter block data")
     
@@ -96,6 +584,11 @@ class BlockchainGUI:
         status = "valid" if is_valid else "invalid"
         messagebox.showinfo("Validation Result", f"Blockchain is {status}")
     
+    def audit_chain(self):
+        is_valid = self.blockchain.validate_chain(full=True, workers=os.cpu_count())
+        status = "valid" if is_valid else f"invalid from block {self.blockchain.verified + 1}"
+        messagebox.showinfo("Audit Result", f"Blockchain is {status}")
+    
     def tamper_block(self):
         if len(self.blockchain.chain) > 1:
             # Get reference to the block we're tampering with
@@ -114,17 +607,52 @@ class BlockchainGUI:
     
     def update_display(self):
         self.chain_display.delete(1.0, tk.END)
-        for block in self.blockchain.chain:
+        chain = self.blockchain.chain
+        for block in chain[max(0, len(chain) - self.DISPLAY_LIMIT):]:
             self.chain_display.insert(tk.END, 
                 f"Block {block.index}\n"
                 f"Timestamp: {block.timestamp}\n"
                 f"Data: {block.data}\n"
                 f"Previous Hash: {block.previous_hash[:10]}...\n"
+                f"Difficulty: {block.difficulty}, Nonce: {block.nonce}\n"
                 f"Hash: {block.hash[:10]}...\n"
                 f"{'-'*40}\n"
             )
 
+def mining_main(args):
+    """Mine a few blocks with 1, 2, 4, ... workers and print the hash rates.
+
+    Usage: mine [difficulty] [blocks] [max workers]
+    """
+    difficulty = int(args[0]) if args else 5
+    blocks = int(args[1]) if len(args) > 1 else 3
+    max_workers = int(args[2]) if len(args) > 2 else os.cpu_count() or 1
+    worker_counts = sorted({min(2 ** k, max_workers) for k in range(max_workers.bit_length() + 1)})
+
+    print(f"Difficulty {difficulty}, {blocks} blocks per run")
+    print(f"{'workers':>8} {'hashes':>12} {'seconds':>8} {'kH/s':>10} {'kH/s/core':>10} {'speedup':>8}")
+    base_rate = None
+    for workers in worker_counts:
+        chain = Blockchain(difficulty=difficulty, workers=workers)
+        hashes = seconds = busy = 0
+        for i in range(blocks):
+            chain.add_block(f"block {i}")
+            stats = chain.mining_stats
+            hashes += stats["hashes"]
+            seconds += stats["seconds"]
+            busy += stats["hashes"] / stats["per_core"] if stats["per_core"] else 0
+        assert chain.validate_chain()
+        chain.close()
+        rate = hashes / seconds
+        base_rate = base_rate or rate
+        print(f"{workers:>8} {hashes:>12} {seconds:>8.2f} {rate / 1000:>10.1f} "
+              f"{hashes / busy / 1000 if busy else 0:>10.1f} {rate / base_rate:>8.2f}")
+
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["mine"]:
+        mining_main(sys.argv[2:])
+        sys.exit()
     root = tk.Tk()
-    gui = BlockchainGUI(root)
-    root.mainloop() 
\ No newline at end of file
+    gui = BlockchainGUI(root, sys.argv[1] if len(sys.argv) > 1 else "blockchain.log")
+    root.mainloop()
+    gui.blockchain.close() 
\ No newline at end of file